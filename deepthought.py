@@ -1,6 +1,8 @@
 import os
 import sys
 import json
+import httpx
+import atexit
 import dotenv
 import logging
 import datetime
@@ -36,11 +38,20 @@ _credential = DefaultAzureCredential()
 _token_provider = get_bearer_token_provider(
     _credential, "https://cognitiveservices.azure.com/.default"
 )
+# One pooled HTTP/2 client shared by every LLM call, so concurrent requests
+# reuse warm TLS connections instead of handshaking per call
+_http_client = httpx.Client(
+    http2=True,
+    limits=httpx.Limits(max_connections=20, max_keepalive_connections=20),
+    timeout=httpx.Timeout(60.0, connect=5.0),
+)
 OAI = AzureOpenAI(
     azure_endpoint=os.environ.get("AZURE_OPENAI_ENDPOINT"),
     azure_ad_token_provider=_token_provider,
     api_version="2025-01-01-preview",
+    http_client=_http_client,
 )
+atexit.register(OAI.close)
 PROCESS_DAYS = 7
 PAPER_PATH = "papers/"
 SUMMARIES_PATH = "summaries/"
@@ -211,6 +222,10 @@ if __name__ == "__main__":
         "--reclassify-projects", action="store_true",
         help="Re-run project classification on relevant papers in the window",
     )
+    parser.add_argument(
+        "--abstract-only", action="store_true",
+        help="Summarize from the arXiv abstract when available instead of the full PDF text",
+    )
     parser.add_argument(
         "--build-viz", action="store_true",
         help="Build interactive graph visualization after sharing results",
@@ -226,34 +241,37 @@ if __name__ == "__main__":
         logger.info("[*] Share-only mode, skipping search/download/summarize...")
     elif args.resummarize:
         count = paper_db.reset_summarized(pull_window)
-        logger.info("[*] Reset %d papers for re-summarization." % count)
+        logger.info("[*] Reset %d papers for re-summarization.", count)
     else:
         logger.info("[*] Executing searches...")
         feeds = execute_searches(base=BASE_URL, params=SEARCHES, force=args.force_search)
-        logger.info("[*] Found %s feeds." % str(len(feeds)))
+        logger.info("[*] Found %d feeds.", len(feeds))
 
         logger.info("[*] Assembling feeds...")
         results = assemble_feeds(feeds=feeds, paper_db=paper_db)
-        logger.info("[*] Deduplication - %s results." % str(len(results)))
+        logger.info("[*] Deduplication - %d results.", len(results))
 
         logger.info("[*] Pruning feeds...")
         valid = prune_feeds(feeds=results, pull_window=pull_window, paper_path=PAPER_PATH)
 
-        logger.info("[*] Downloading %s papers..." % str(len(valid)))
-        download_papers(results=valid, paper_db=paper_db, paper_path=PAPER_PATH)
+        logger.info("[*] Downloading %d papers...", len(valid))
+        download_papers(
+            results=valid, paper_db=paper_db, paper_path=PAPER_PATH, stream=True
+        )
 
     if not args.share_only:
         logger.info("[*] Assembling records for summary...")
         records = assemble_records(pull_window=pull_window, paper_db=paper_db)
-        logger.info("[*] Found %s records to summarize." % str(len(records)))
+        logger.info("[*] Found %d records to summarize.", len(records))
 
-        logger.info("[*] Summarizing %s papers..." % str(len(records)))
+        logger.info("[*] Summarizing %d papers...", len(records))
         summarize_records(
             records=records,
             summarizer=OAI,
             summarizer_prompt=SYSTEM_PROMPT,
             paper_path=PAPER_PATH,
             paper_db=paper_db,
+            use_abstract_only=args.abstract_only,
         )
 
         logger.info("[*] Classifying relevance...")
@@ -287,7 +305,7 @@ if __name__ == "__main__":
                         for idx in indices:
                             if 0 <= idx < len(borderline):
                                 paper_db.update(borderline[idx]["id"], {"relevant": True})
-                                logger.info("Included: %s" % borderline[idx]["title"])
+                                logger.info("Included: %s", borderline[idx]["title"])
                 except (EOFError, KeyboardInterrupt):
                     pass  # non-interactive environment, skip
 
@@ -314,7 +332,7 @@ if __name__ == "__main__":
             )
             project_prompt = PROJECT_RELEVANCE_PROMPT.format(projects=project_list_str)
             project_ids = [p["id"] for p in PROJECTS]
-            logger.info("[*] Classifying project relevance for %d papers..." % len(relevant_papers))
+            logger.info("[*] Classifying project relevance for %d papers...", len(relevant_papers))
             classify_project_relevance(
                 records=relevant_papers,
                 classifier=OAI,
@@ -6,6 +6,14 @@ from email.mime.text import MIMEText
 
 logger = logging.getLogger("AIRT-GAI-SecNews")
 
+# Fixed HTML document wrapper around the per-run records in the .eml body
+_EML_HTML_PREFIX = (
+    '<html><head><meta charset="utf-8"></head>'
+    '<body style="font-family:Calibri,Arial,sans-serif;'
+    'max-width:800px;padding:16px;font-size:14px;">'
+)
+_EML_HTML_SUFFIX = '</body></html>'
+
 
 def _format_authors(authors: list, max_authors: int = 3) -> str:
     """Format author list, truncating to first *max_authors* with 'et al.' if needed."""
@@ -20,10 +28,10 @@ def _format_record_markdown(record: dict) -> str:
     """Format a single record for markdown."""
     score = record.get("interest_score")
     score_str = f" `{score}/10`" if score is not None else ""
-    content = (
+    chunks = [
         f"{record['emoji']} **{record['title']}** [source]({record['url']}) "
         f"#{record['tag']}{score_str} \n"
-    )
+    ]
     authors = record.get("authors", [])
     affiliations = record.get("affiliations", [])
     if authors or affiliations:
@@ -32,14 +40,14 @@ def _format_record_markdown(record: dict) -> str:
             parts.append(_format_authors(authors))
         if affiliations:
             parts.append("(" + ", ".join(affiliations) + ")")
-        content += f"\n *{' '.join(parts)}*"
-    content += f"\n\n {record['one_liner']}"
-    for point in record["points"]:
-        content += f"\n - {point}"
+        chunks.append(f"\n *{' '.join(parts)}*")
+    chunks.append(f"\n\n {record['one_liner']}")
+    chunks.extend(f"\n - {point}" for point in record["points"])
     projects = record.get("projects", [])
     if projects:
-        content += f"\n\n \U0001f4cc *Relevant to: {', '.join(projects)}*"
-    return content + "\n\n<br>\n\n"
+        chunks.append(f"\n\n \U0001f4cc *Relevant to: {', '.join(projects)}*")
+    chunks.append("\n\n<br>\n\n")
+    return "".join(chunks)
 
 
 def _format_projects_html(record: dict) -> str:
@@ -113,7 +121,7 @@ def share_results(
             records = [r for r in records if r.get("relevant") is True]
             filtered = before - len(records)
             if filtered:
-                logger.info(f"Filtered out {filtered} irrelevant papers.")
+                logger.info("Filtered out %d irrelevant papers.", filtered)
 
         if not records:
             logger.info("No relevant papers to share after filtering.")
@@ -125,9 +133,12 @@ def share_results(
             reverse=True,
         )
 
-        logger.info(f"Found {len(records)} records to share.")
+        logger.info("Found %d records to share.", len(records))
         for record in records:
-            logger.debug(f"[{record.get('interest_score', '?')}/10] {record['published']} {record['title']}")
+            logger.debug(
+                "[%s/10] %s %s",
+                record.get("interest_score", "?"), record["published"], record["title"],
+            )
 
         markdown = "".join(_format_record_markdown(r) for r in records)
         html = "".join(_format_record_html(r) for r in records)
@@ -137,7 +148,7 @@ def share_results(
         return True
 
     except Exception as e:
-        logger.error(f"Error in share_results: {e}")
+        logger.error("Error in share_results: %s", e)
         return False
 
 
@@ -151,10 +162,10 @@ def _create_markdown_file(summaries_path: str, markdown_content: str) -> None:
         markdown_file = summaries_dir / filename
 
         markdown_file.write_text(markdown_content)
-        logger.info(f"Markdown file created: {markdown_file}")
+        logger.info("Markdown file created: %s", markdown_file)
 
     except Exception as e:
-        logger.error(f"Failed to create markdown file: {e}")
+        logger.error("Failed to create markdown file: %s", e)
 
 
 def _create_eml_file(summaries_path: str, html_content: str) -> None:
@@ -166,13 +177,7 @@ def _create_eml_file(summaries_path: str, html_content: str) -> None:
         today = datetime.datetime.now().strftime("%Y-%m-%d")
         filename = f"{today}.eml"
 
-        body_html = (
-            '<html><head><meta charset="utf-8"></head>'
-            '<body style="font-family:Calibri,Arial,sans-serif;'
-            'max-width:800px;padding:16px;font-size:14px;">'
-            f'{html_content}'
-            '</body></html>'
-        )
+        body_html = _EML_HTML_PREFIX + html_content + _EML_HTML_SUFFIX
 
         msg = MIMEText(body_html, "html", "utf-8")
         msg["Subject"] = f"[{today}] AIRT Gen AI Security News"
@@ -180,7 +185,7 @@ def _create_eml_file(summaries_path: str, html_content: str) -> None:
 
         eml_file = summaries_dir / filename
         eml_file.write_text(msg.as_string())
-        logger.info(f"EML file created: {eml_file}")
+        logger.info("EML file created: %s", eml_file)
 
     except Exception as e:
-        logger.error(f"Failed to create EML file: {e}")
+        logger.error("Failed to create EML file: %s", e)
@@ -0,0 +1,16 @@
+import datetime
+import functools
+
+
+@functools.lru_cache(maxsize=1 << 16)
+def normalize_iso(iso_str):
+    """Normalize an ISO 8601 date string to a consistent UTC format."""
+    # Fast paths for the UTC shapes arXiv actually sends
+    if len(iso_str) == 20 and iso_str[10] == "T" and iso_str[19] == "Z":
+        return iso_str
+    if len(iso_str) == 25 and iso_str[10] == "T" and iso_str.endswith("+00:00"):
+        return iso_str[:19] + "Z"
+    iso_str = iso_str.replace("Z", "+00:00")
+    dt = datetime.datetime.fromisoformat(iso_str)
+    dt_utc = dt.astimezone(datetime.timezone.utc)
+    return dt_utc.strftime("%Y-%m-%dT%H:%M:%SZ")
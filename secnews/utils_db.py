@@ -1,57 +1,141 @@
-import json
+import os
+import bisect
 import logging
-import datetime
+import orjson
 from pathlib import Path
+from secnews.utils_dates import normalize_iso as _normalize_date
 
 logger = logging.getLogger("AIRT-GAI-SecNews")
 
 
-def _normalize_date(iso_str):
-    """Normalize an ISO 8601 date string to a consistent UTC format."""
-    iso_str = iso_str.replace("Z", "+00:00")
-    dt = datetime.datetime.fromisoformat(iso_str)
-    dt_utc = dt.astimezone(datetime.timezone.utc)
-    return dt_utc.strftime("%Y-%m-%dT%H:%M:%SZ")
-
-
 class PaperDB:
-    """Simple JSON-file-backed paper database replacing MongoDB."""
+    """Simple JSON-file-backed paper database replacing MongoDB.
+
+    Every mutation is written to disk immediately, except inside a
+    ``with paper_db:`` block, where writes are deferred and flushed once
+    when the outermost block exits.
+    """
 
     def __init__(self, path):
         self.path = Path(path)
         if self.path.exists():
-            self._data = json.loads(self.path.read_text())
+            self._data = orjson.loads(self.path.read_bytes())
         else:
             self._data = []
+        self._batch_depth = 0
+        self._dirty = False
+        self._build_index()
+
+    def __enter__(self):
+        self._batch_depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._batch_depth -= 1
+        if not self._batch_depth:
+            self.flush()  # persist completed work even if the block raised
+
+    def _build_index(self):
+        """Rebuild the in-memory indexes used by has_url() and find()."""
+        self._urls = {r["url"] for r in self._data}
+        self._by_published = sorted(
+            (r["published"], i) for i, r in enumerate(self._data)
+        )
+        # Same (published, position) entries, bucketed by summarized value
+        self._by_summarized = {}
+        for entry in self._by_published:
+            summarized = self._data[entry[1]].get("summarized")
+            self._by_summarized.setdefault(summarized, []).append(entry)
+
+    def _set_summarized(self, i, value):
+        """Set the summarized flag on record *i*, moving it between buckets."""
+        record = self._data[i]
+        entry = (record["published"], i)
+        bucket = self._by_summarized[record.get("summarized")]
+        del bucket[bisect.bisect_left(bucket, entry)]
+        record["summarized"] = value
+        bisect.insort(self._by_summarized.setdefault(value, []), entry)
 
     def _save(self):
-        self.path.write_text(json.dumps(self._data, indent=2))
+        """Write the whole DB to a temp file and atomically swap it in."""
+        data = orjson.dumps(
+            self._data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+        )
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, self.path)
+
+    def _changed(self):
+        """Record a mutation, writing it out unless a batch is open."""
+        self._dirty = True
+        if not self._batch_depth:
+            self.flush()
+
+    def flush(self):
+        """Write pending changes to disk, if there are any."""
+        if self._dirty:
+            self._save()
+            self._dirty = False
 
     def has_url(self, url):
         """Check if a paper with this URL already exists."""
-        return any(r["url"] == url for r in self._data)
+        return url in self._urls
 
     def insert(self, record):
         """Insert a new paper record (normalizes published date)."""
+        self._append(record)
+        self._changed()
+
+    def insert_many(self, records):
+        """Insert several paper records with a single write to disk."""
+        count = 0
+        for record in records:
+            self._append(record)
+            count += 1
+        if count:
+            self._changed()
+        return count
+
+    def _append(self, record):
+        """Add a copy of *record* to the data and indexes without saving."""
         record = dict(record)
         record["published"] = _normalize_date(record["published"])
         self._data.append(record)
-        self._save()
+        self._urls.add(record["url"])
+        entry = (record["published"], len(self._data) - 1)
+        bisect.insort(self._by_published, entry)
+        bisect.insort(
+            self._by_summarized.setdefault(record.get("summarized"), []), entry
+        )
 
     def update(self, paper_id, fields):
         """Update fields on a paper by its id."""
-        for record in self._data:
+        for i, record in enumerate(self._data):
             if record["id"] == paper_id:
+                if "summarized" in fields:
+                    self._set_summarized(i, fields["summarized"])
                 record.update(fields)
-                self._save()
+                if "published" in fields or "url" in fields:
+                    self._build_index()
+                self._changed()
                 return True
         return False
 
     def find(self, published_gte=None, summarized=None):
-        """Query papers by optional filters."""
+        """Query papers by optional filters.
+
+        ``published_gte`` is answered from the sorted date index (bucketed by
+        ``summarized`` when both filters are given), so results filtered by
+        date come back ordered by publication date.
+        """
+        if published_gte is not None and summarized is not None:
+            bucket = self._by_summarized.get(summarized, [])
+            start = bisect.bisect_left(bucket, (published_gte,))
+            return [self._data[i] for _, i in bucket[start:]]
         results = self._data
         if published_gte is not None:
-            results = [r for r in results if r["published"] >= published_gte]
+            start = bisect.bisect_left(self._by_published, (published_gte,))
+            results = [self._data[i] for _, i in self._by_published[start:]]
         if summarized is not None:
             results = [r for r in results if r.get("summarized") == summarized]
         return results
@@ -59,12 +143,14 @@ class PaperDB:
     def reset_summarized(self, published_gte):
         """Reset summarized papers in the window so they can be re-processed."""
         count = 0
-        for record in self._data:
-            if record["published"] >= published_gte and record.get("summarized"):
-                record["summarized"] = False
+        start = bisect.bisect_left(self._by_published, (published_gte,))
+        for _, i in self._by_published[start:]:
+            record = self._data[i]
+            if record.get("summarized"):
+                self._set_summarized(i, False)
                 for key in ("points", "one_liner", "emoji", "tag", "affiliations", "relevant", "projects", "interest_score"):
                     record.pop(key, None)
                 count += 1
         if count:
-            self._save()
+            self._changed()
         return count
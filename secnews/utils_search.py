@@ -1,3 +1,4 @@
+import os
 import json
 import time
 import random
@@ -8,9 +9,13 @@ import requests
 import feedparser
 
 from pathlib import Path
+from secnews.utils_dates import normalize_iso as _normalize_iso
 
 logger = logging.getLogger("AIRT-GAI-SecNews")
 
+# Shared session so paginated arXiv queries reuse one keep-alive connection
+_SESSION = requests.Session()
+
 
 def _load_search_state(state_path):
     """Load the search state file (maps query -> last completion timestamp)."""
@@ -71,7 +76,7 @@ def execute_searches(
             payload_str = urllib.parse.urlencode(current_params, safe=":+")
             logger.debug("Executing search with params: %s", payload_str)
 
-            response = requests.get(base, params=payload_str)
+            response = _SESSION.get(base, params=payload_str)
             feed = feedparser.parse(response.content)
 
             # Check if the API returned a valid response with OpenSearch metadata
@@ -156,44 +161,64 @@ def execute_searches(
 # Feed processing functions
 
 
-def process_feed(response, paper_db) -> list:
-    """Process feed into list, inserting new papers into the database."""
-    results = []
-    feed = feedparser.parse(response)
-    for entry in feed.entries:
+def _parse_feed(content) -> list:
+    """Parse a raw arXiv Atom feed into paper records."""
+    records = []
+    for entry in feedparser.parse(content).entries:
         url = "%s.pdf" % entry.id.replace("abs", "pdf")
         authors = [a.get("name", "") for a in getattr(entry, "authors", [])]
-        obj = {
+        records.append({
             "id": entry.id.split("/abs/")[-1],
             "url": url,
             "published": entry.published,
             "title": entry.title,
             "authors": authors,
+            "abstract": " ".join(entry.get("summary", "").split()),
             "downloaded": False,
             "summarized": False,
-        }
+        })
+    return records
+
+
+def process_feed(response, paper_db) -> list:
+    """Process feed into list, inserting new papers into the database."""
+    results = []
+    new = {}
+    for obj in _parse_feed(response):
         results.append(obj)
-        if not paper_db.has_url(obj["url"]):
-            paper_db.insert(obj)
+        if obj["url"] not in new and not paper_db.has_url(obj["url"]):
+            new[obj["url"]] = obj
+    paper_db.insert_many(new.values())
     return results
 
 
 def assemble_feeds(feeds: list, paper_db) -> list:
     """Process all the feeds into a deduplicated list."""
-    results = []
-    for feed in feeds:
-        results += process_feed(feed, paper_db)
     seen = set()
     deduplicated = []
-    for item in results:
-        if item["url"] not in seen:
-            seen.add(item["url"])
-            deduplicated.append(item)
+    with paper_db:  # one DB write for all feeds
+        for feed in feeds:
+            for item in process_feed(feed, paper_db):
+                if item["url"] not in seen:
+                    seen.add(item["url"])
+                    deduplicated.append(item)
     return deduplicated
 
 
+def _downloaded_ids(paper_path):
+    """Return the ids of all PDFs saved in *paper_path* (empty if it doesn't exist)."""
+    try:
+        with os.scandir(paper_path) as entries:
+            return {
+                e.name[:-4] for e in entries if e.name.endswith(".pdf") and e.is_file()
+            }
+    except FileNotFoundError:
+        return set()
+
+
 def prune_feeds(feeds: list, pull_window: str, paper_path: str) -> list:
     """Prune the list of feeds to only those within the time window and not yet downloaded."""
+    downloaded = _downloaded_ids(paper_path)  # one directory scan, not a stat per feed
     valid = []
     for feed in feeds:
         # published is already normalized to ISO 8601 by PaperDB.insert()
@@ -201,16 +226,7 @@ def prune_feeds(feeds: list, pull_window: str, paper_path: str) -> list:
         published = _normalize_iso(feed["published"])
         if published < pull_window:
             continue
-        filename = Path(paper_path) / (feed["id"] + ".pdf")
-        if filename.is_file():
+        if feed["id"] in downloaded:
             continue
         valid.append(feed)
     return valid
-
-
-def _normalize_iso(iso_str):
-    """Normalize an ISO 8601 date to a consistent UTC format for comparison."""
-    iso_str = iso_str.replace("Z", "+00:00")
-    dt = datetime.datetime.fromisoformat(iso_str)
-    dt_utc = dt.astimezone(datetime.timezone.utc)
-    return dt_utc.strftime("%Y-%m-%dT%H:%M:%SZ")
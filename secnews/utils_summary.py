@@ -1,38 +1,130 @@
 import os
 import json
 import time
+import hashlib
 import logging
+import tempfile
 
-from pypdf import PdfReader
-from secnews.utils_papers import download_paper, read_pages
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from secnews.utils_papers import download_papers, read_pdf
 
 
 logger = logging.getLogger("AIRT-GAI-SecNews")
 
+# Abstracts shorter than this fall back to full-text PDF summarization
+MIN_ABSTRACT_CHARS = 200
 
-def _validate_affiliations(affiliations, arxiv_authors, pdf_text, paper_id):
+# Keys a summary response must carry to be stored (and cached)
+SUMMARY_KEYS = ("findings", "one_liner")
+
+# Records summarized concurrently (each worker keeps its own rate-limit pause)
+SUMMARY_WORKERS = 4
+
+# On-disk LLM response cache, enabled with SECNEWS_LLM_CACHE=1
+LLM_CACHE_DIR = Path.home() / ".cache" / "secnews" / "llm"
+
+
+def _llm_cache_path(model, system_prompt, user_content):
+    """Return the cache file for an exact (model, prompt, content) triple."""
+    key = hashlib.sha256(
+        "\0".join((model or "", system_prompt, user_content)).encode()
+    ).hexdigest()
+    return LLM_CACHE_DIR / f"{key}.json"
+
+
+def _has_keys(loaded, required):
+    """Whether a parsed LLM response is an object carrying every required key."""
+    return isinstance(loaded, dict) and all(key in loaded for key in required)
+
+
+def _chat_json(client, system_prompt, user_content, required=()):
+    """Run a JSON-mode chat completion and return the parsed response.
+
+    With SECNEWS_LLM_CACHE=1, parsed responses are cached on disk keyed by
+    model, system prompt and user content, so re-running the same prompt on
+    the same paper skips the API call. Any prompt or content change produces
+    a new key, so entries never go stale. Responses missing any of the
+    *required* keys are returned but never cached, and such entries already
+    on disk are treated as misses, so a bad reply can be retried.
+    """
+    model = os.environ.get("AZURE_OPENAI_SUMMARY_MODEL_NAME")
+    use_cache = os.environ.get("SECNEWS_LLM_CACHE") == "1"
+    if use_cache:
+        cache_path = _llm_cache_path(model, system_prompt, user_content)
+        try:
+            cached = json.loads(cache_path.read_text())
+            if _has_keys(cached, required):
+                return cached
+        except (OSError, ValueError):
+            pass  # miss or unreadable entry, fall through to the API
+
+    result = client.chat.completions.create(
+        model=model,
+        messages=[
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_content},
+        ],
+        response_format={"type": "json_object"},
+    )
+    loaded = json.loads(result.choices[0].message.content)
+
+    if use_cache and _has_keys(loaded, required):
+        # Write to a temp file and rename so readers never see partial JSON
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", dir=cache_path.parent, suffix=".tmp", delete=False
+        ) as f:
+            f.write(json.dumps(loaded))
+        os.replace(f.name, cache_path)
+    return loaded
+
+
+def _title_page(pdf_text):
+    """Return the case-folded title page (first ~3000 chars) of a PDF's text."""
+    return pdf_text[:3000].casefold()
+
+
+def _last_names(authors):
+    """Return the case-folded last names of a list of author names."""
+    return {name.split()[-1].casefold() for name in authors if name}
+
+
+def _has_abstract(record):
+    """Whether the record carries an arXiv abstract long enough to summarize."""
+    return len(record.get("abstract", "")) >= MIN_ABSTRACT_CHARS
+
+
+def _abstract_content(record):
+    """Build the LLM input from arXiv metadata instead of the PDF text."""
+    return (
+        f"Title: {record['title']}\n"
+        f"Authors: {', '.join(record.get('authors', []))}\n"
+        f"Abstract: {record['abstract']}"
+    )
+
+
+def _validate_affiliations(affiliations, last_names, title_page, paper_id):
     """Cross-check LLM-extracted affiliations against arXiv author metadata.
 
-    Verifies that at least some arXiv author last names appear in the PDF text
-    (confirming the PDF matches the metadata). If the authors don't match,
-    the affiliations are likely hallucinated and are discarded.
+    Verifies that at least some arXiv author last names (see ``_last_names``)
+    appear on the PDF title page (see ``_title_page``), confirming the PDF
+    matches the metadata. If the authors don't match, the affiliations are
+    likely hallucinated and are discarded.
     """
-    # Extract last names from arXiv metadata for fuzzy matching
-    arxiv_last_names = {name.split()[-1].lower() for name in arxiv_authors if name}
-    if not arxiv_last_names:
+    if not last_names:
         # No arXiv authors to validate against — keep affiliations as-is
         return affiliations
-    pdf_lower = pdf_text[:3000].lower()  # check first ~3000 chars (title page)
 
     # Count how many arXiv author last names appear in the PDF title page
-    matched = sum(1 for name in arxiv_last_names if name in pdf_lower)
-    match_ratio = matched / len(arxiv_last_names) if arxiv_last_names else 0
+    matched = sum(1 for name in last_names if name in title_page)
+    match_ratio = matched / len(last_names)
 
     if match_ratio < 0.5:
         logger.warning(
             "Author mismatch for %s: only %d/%d arXiv authors found in PDF. "
             "Discarding affiliations.",
-            paper_id, matched, len(arxiv_last_names),
+            paper_id, matched, len(last_names),
         )
         return []
 
@@ -45,68 +137,109 @@ def summarize_records(
     summarizer_prompt: str,
     paper_path: str,
     paper_db,
+    use_abstract_only: bool = False,
+    max_workers: int = SUMMARY_WORKERS,
 ) -> bool:
-    """Use LLM to summarize paper content."""
-    for record in records:
-        time.sleep(3)  # To avoid rate limiting
-        logger.debug("Processing: %s" % record["id"])
-        filename = os.path.join(paper_path, "%s.pdf" % record["id"])
+    """Use LLM to summarize paper content.
+
+    With ``use_abstract_only=True``, records that carry an arXiv abstract of
+    at least ``MIN_ABSTRACT_CHARS`` are summarized from title, authors and
+    abstract without parsing the PDF. Other records use the full PDF text.
+
+    Up to ``max_workers`` records are summarized concurrently; results are
+    written to ``paper_db`` from the calling thread as they come back.
+    """
+    def from_abstract(record):
+        return use_abstract_only and _has_abstract(record)
+
+    # Fetch any missing PDFs up front in one concurrent batch instead of
+    # blocking on a separate download per record inside the loop
+    missing = [
+        r for r in records
+        if not from_abstract(r)
+        and not os.path.isfile(os.path.join(paper_path, "%s.pdf" % r["id"]))
+    ]
+    if missing:
+        logger.info("Downloading %d missing papers...", len(missing))
+        download_papers(results=missing, paper_db=paper_db, paper_path=paper_path)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        summaries = pool.map(
+            lambda r: _summarize_one(
+                r, summarizer, summarizer_prompt, paper_path, from_abstract(r)
+            ),
+            records,
+        )
+        for record, fields in zip(records, summaries):
+            if fields is not None:
+                paper_db.update(record["id"], fields)
+    return True
+
+
+def _summarize_one(record, summarizer, summarizer_prompt, paper_path, use_abstract):
+    """Summarize a single record, returning the fields to store or None on failure.
+
+    Runs on a worker thread, so it only reads *record* and never touches the DB.
+    ``read_pdf`` serializes its non-thread-safe PDFium calls, so workers can
+    call it directly.
+    """
+    time.sleep(3)  # To avoid rate limiting
+    logger.debug("Processing: %s", record["id"])
+    filename = os.path.join(paper_path, "%s.pdf" % record["id"])
+    if use_abstract:
+        content = _abstract_content(record)
+        title_page = None  # only read from the PDF if affiliations need it
+    else:
         try:
-            reader = PdfReader(filename)
-        except FileNotFoundError:
-            download_paper(record["url"], paper_db, paper_path)
-            try:
-                reader = PdfReader(filename)
-            except Exception as e:
-                logger.error(e)
-                continue
+            content = read_pdf(filename)["content"]
         except Exception as e:
-            logger.error(f"Error reading {filename}: {e}")
-            continue
+            logger.error("Error reading %s: %s", filename, e)
+            return None
+        title_page = _title_page(content)
+    try:
+        loaded = _chat_json(
+            summarizer, summarizer_prompt, content, required=SUMMARY_KEYS
+        )
+        logger.debug("Processed: %s", record["id"])
+        logger.debug("Loaded: %r", loaded)
 
-        metadata = read_pages(reader)
-        try:
-            results = summarizer.chat.completions.create(
-                model=os.environ.get("AZURE_OPENAI_SUMMARY_MODEL_NAME"),
-                messages=[
-                    {"role": "system", "content": summarizer_prompt},
-                    {"role": "user", "content": metadata["content"]},
-                ],
-                response_format={"type": "json_object"},
+        affiliations = loaded.get("affiliations", [])
+        # Validate: only keep affiliations if the LLM-extracted authors
+        # overlap with the arXiv metadata authors (guard against hallucination)
+        arxiv_authors = record.get("authors", [])
+        if affiliations and arxiv_authors:
+            if title_page is None:
+                # Abstract input has no title page; check the PDF's first
+                # page if we have it, otherwise the affiliations are dropped
+                try:
+                    title_page = _title_page(
+                        read_pdf(filename, max_pages=1)["content"]
+                    )
+                except Exception:
+                    title_page = ""
+            affiliations = _validate_affiliations(
+                affiliations, _last_names(arxiv_authors), title_page, record["id"]
             )
-            loaded = json.loads(results.choices[0].message.content)
-            logger.debug("Processed: %s" % record["id"])
-            logger.debug(loaded)
-
-            affiliations = loaded.get("affiliations", [])
-            # Validate: only keep affiliations if the LLM-extracted authors
-            # overlap with the arXiv metadata authors (guard against hallucination)
-            arxiv_authors = record.get("authors", [])
-            if affiliations and arxiv_authors:
-                affiliations = _validate_affiliations(
-                    affiliations, arxiv_authors, metadata["content"], record["id"]
-                )
-
-            # Extract and clamp interest_score to 1-10, default 5 if missing/malformed
-            try:
-                raw_score = int(loaded.get("interest_score", 5))
-                interest_score = max(1, min(10, raw_score))
-            except (TypeError, ValueError):
-                interest_score = 5
-
-            paper_db.update(record["id"], {
-                "summarized": True,
-                "points": loaded["findings"],
-                "one_liner": loaded["one_liner"],
-                "emoji": loaded.get("emoji", "\U0001f50d"),
-                "tag": loaded.get("tag", "general"),
-                "affiliations": affiliations,
-                "interest_score": interest_score,
-            })
-        except Exception as e:
-            logger.error(f"Error summarizing {record['id']}: {e}")
-            continue
-    return True
+
+        # Extract and clamp interest_score to 1-10, default 5 if missing/malformed
+        try:
+            raw_score = int(loaded.get("interest_score", 5))
+            interest_score = max(1, min(10, raw_score))
+        except (TypeError, ValueError):
+            interest_score = 5
+
+        return {
+            "summarized": True,
+            "points": loaded["findings"],
+            "one_liner": loaded["one_liner"],
+            "emoji": loaded.get("emoji", "\U0001f50d"),
+            "tag": loaded.get("tag", "general"),
+            "affiliations": affiliations,
+            "interest_score": interest_score,
+        }
+    except Exception as e:
+        logger.error("Error summarizing %s: %s", record["id"], e)
+        return None
 
 
 def classify_project_relevance(records, classifier, prompt, project_ids, paper_db):
@@ -129,23 +262,15 @@ def classify_project_relevance(records, classifier, prompt, project_ids, paper_d
         prompt_text = f"Title: {title}\nSummary: {one_liner}"
 
         try:
-            result = classifier.chat.completions.create(
-                model=os.environ.get("AZURE_OPENAI_SUMMARY_MODEL_NAME"),
-                messages=[
-                    {"role": "system", "content": prompt},
-                    {"role": "user", "content": prompt_text},
-                ],
-                response_format={"type": "json_object"},
-            )
-            loaded = json.loads(result.choices[0].message.content)
+            loaded = _chat_json(classifier, prompt, prompt_text)
             matched = loaded.get("projects", [])
             # Validate: strip any hallucinated project IDs
             matched = [pid for pid in matched if pid in valid_ids]
             paper_db.update(record["id"], {"projects": matched})
             if matched:
-                logger.info(f"Project match for '{title}': {matched}")
+                logger.info("Project match for '%s': %s", title, matched)
         except Exception as e:
-            logger.error(f"Error classifying projects for {record['id']}: {e}")
+            logger.error("Error classifying projects for %s: %s", record["id"], e)
             paper_db.update(record["id"], {"projects": []})
 
 
@@ -169,20 +294,12 @@ def classify_relevance(records, classifier, relevance_prompt, paper_db):
         prompt_text = f"Title: {title}\nSummary: {one_liner}"
 
         try:
-            result = classifier.chat.completions.create(
-                model=os.environ.get("AZURE_OPENAI_SUMMARY_MODEL_NAME"),
-                messages=[
-                    {"role": "system", "content": relevance_prompt},
-                    {"role": "user", "content": prompt_text},
-                ],
-                response_format={"type": "json_object"},
-            )
-            loaded = json.loads(result.choices[0].message.content)
+            loaded = _chat_json(classifier, relevance_prompt, prompt_text)
             relevant = loaded.get("relevant", True)
             paper_db.update(record["id"], {"relevant": relevant})
             if not relevant:
-                logger.info(f"Marked irrelevant: {title}")
+                logger.info("Marked irrelevant: %s", title)
         except Exception as e:
-            logger.error(f"Error classifying {record['id']}: {e}")
+            logger.error("Error classifying %s: %s", record["id"], e)
             # Default to relevant on error to avoid dropping good papers
             paper_db.update(record["id"], {"relevant": True})
@@ -1,4 +1,6 @@
 import os
+from types import SimpleNamespace
+
 import pytest
 
 # Root of the project
@@ -9,6 +11,36 @@ PAPERS_DIR = os.path.join(PROJECT_ROOT, "papers")
 REAL_PDF_ID = "2505.24201v1"
 
 
+class _StubClient:
+    """Plain stand-in for an Azure OpenAI client whose completions return *content*.
+
+    Use it where a test never inspects the calls; tests that assert on calls
+    or need side effects use a MagicMock instead.
+    """
+
+    def __init__(self, content):
+        response = SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=content))]
+        )
+        self.chat = SimpleNamespace(
+            completions=SimpleNamespace(create=lambda **kwargs: response)
+        )
+
+
+@pytest.fixture
+def isolated_llm_cache(tmp_path, monkeypatch):
+    """Keep the opt-in LLM response cache off and out of ~/.cache.
+
+    Modules whose tests reach ``_chat_json`` apply it to every test with
+    ``pytestmark = pytest.mark.usefixtures("isolated_llm_cache")``. Tests that
+    exercise the cache set SECNEWS_LLM_CACHE=1 themselves.
+    """
+    from secnews import utils_summary
+
+    monkeypatch.delenv("SECNEWS_LLM_CACHE", raising=False)
+    monkeypatch.setattr(utils_summary, "LLM_CACHE_DIR", tmp_path / "llm_cache")
+
+
 @pytest.fixture
 def tmp_db(tmp_path):
     """A fresh PaperDB in a temporary directory."""
@@ -32,6 +64,31 @@ def real_pdf_id():
     return REAL_PDF_ID
 
 
+@pytest.fixture(scope="session")
+def azure_openai_client():
+    """A real Azure OpenAI client shared by all integration tests in the session.
+
+    Skips the requesting test when no endpoint is configured.
+    """
+    import dotenv
+    from azure.identity import DefaultAzureCredential, get_bearer_token_provider
+    from openai import AzureOpenAI
+
+    dotenv.load_dotenv(".env")
+    endpoint = os.environ.get("AZURE_OPENAI_ENDPOINT")
+    if not endpoint:
+        pytest.skip("Azure OpenAI endpoint not configured")
+
+    token_provider = get_bearer_token_provider(
+        DefaultAzureCredential(), "https://cognitiveservices.azure.com/.default"
+    )
+    return AzureOpenAI(
+        azure_endpoint=endpoint,
+        azure_ad_token_provider=token_provider,
+        api_version="2025-01-01-preview",
+    )
+
+
 @pytest.fixture
 def sample_summarized_record():
     """A realistic summarized record."""
@@ -82,6 +139,8 @@ SAMPLE_ARXIV_FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
     <id>http://arxiv.org/abs/2601.00001v1</id>
     <published>2026-01-15T10:30:00Z</published>
     <title>Test Paper Alpha: LLM Jailbreak</title>
+    <summary>We study jailbreak attacks
+  on large language models.</summary>
     <author><name>Alice Smith</name></author>
     <author><name>Bob Jones</name></author>
   </entry>
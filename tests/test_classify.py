@@ -0,0 +1,278 @@
+"""Tests for secnews.utils_summary — relevance classification and affiliation checks.
+
+None of these tests read a PDF, so they live apart from the summarization tests.
+"""
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from secnews.utils_summary import (
+    classify_relevance,
+    classify_project_relevance,
+    _validate_affiliations,
+    _last_names,
+    _title_page,
+)
+from tests.conftest import _StubClient
+
+# Keep the opt-in LLM response cache off and out of ~/.cache
+pytestmark = pytest.mark.usefixtures("isolated_llm_cache")
+
+
+# ---------------------------------------------------------------------------
+# Relevance classification
+# ---------------------------------------------------------------------------
+
+
+class TestClassifyRelevance:
+
+    _RESPONSES = {flag: json.dumps({"relevant": flag}) for flag in (True, False)}
+
+    def _make_classifier(self, relevant):
+        return _StubClient(self._RESPONSES[relevant])
+
+    def test_marks_relevant_true(self, tmp_db):
+        tmp_db.insert({
+            "id": "r1", "url": "http://x.pdf",
+            "published": "2026-02-15T00:00:00Z",
+            "title": "Jailbreak Attack on LLMs",
+            "downloaded": True, "summarized": True,
+            "tag": "security", "one_liner": "About jailbreaks.",
+            "emoji": "🛡️", "points": ["A"],
+        })
+        classify_relevance(
+            records=tmp_db.find(summarized=True),
+            classifier=self._make_classifier(True),
+            relevance_prompt="test",
+            paper_db=tmp_db,
+        )
+        assert tmp_db.find()[0]["relevant"] is True
+
+    def test_marks_relevant_false(self, tmp_db):
+        tmp_db.insert({
+            "id": "r2", "url": "http://x.pdf",
+            "published": "2026-02-15T00:00:00Z",
+            "title": "ZK Proofs for ML",
+            "downloaded": True, "summarized": True,
+            "tag": "security", "one_liner": "About zero knowledge.",
+            "emoji": "🛡️", "points": ["A"],
+        })
+        classify_relevance(
+            records=tmp_db.find(summarized=True),
+            classifier=self._make_classifier(False),
+            relevance_prompt="test",
+            paper_db=tmp_db,
+        )
+        assert tmp_db.find()[0]["relevant"] is False
+
+    def test_general_tag_auto_irrelevant(self, tmp_db):
+        """Papers tagged 'general' are auto-marked irrelevant without an LLM call."""
+        tmp_db.insert({
+            "id": "g1", "url": "http://x.pdf",
+            "published": "2026-02-15T00:00:00Z",
+            "title": "Multi-armed Bandits",
+            "downloaded": True, "summarized": True,
+            "tag": "general", "one_liner": "About bandits.",
+            "emoji": "🎰", "points": ["A"],
+        })
+        # Classifier should NOT be called
+        classifier = MagicMock()
+        classify_relevance(
+            records=tmp_db.find(summarized=True),
+            classifier=classifier,
+            relevance_prompt="test",
+            paper_db=tmp_db,
+        )
+        classifier.chat.completions.create.assert_not_called()
+        assert tmp_db.find()[0]["relevant"] is False
+
+    def test_skips_already_classified(self, tmp_db):
+        """Records with 'relevant' already set are not re-classified."""
+        tmp_db.insert({
+            "id": "s1", "url": "http://x.pdf",
+            "published": "2026-02-15T00:00:00Z",
+            "title": "Already Classified",
+            "downloaded": True, "summarized": True,
+            "tag": "security", "one_liner": "Done.",
+            "emoji": "🛡️", "points": ["A"],
+            "relevant": True,
+        })
+        classifier = MagicMock()
+        classify_relevance(
+            records=tmp_db.find(summarized=True),
+            classifier=classifier,
+            relevance_prompt="test",
+            paper_db=tmp_db,
+        )
+        classifier.chat.completions.create.assert_not_called()
+
+    def test_defaults_to_relevant_on_error(self, tmp_db):
+        """On LLM error, paper is marked relevant to avoid dropping good papers."""
+        tmp_db.insert({
+            "id": "e1", "url": "http://x.pdf",
+            "published": "2026-02-15T00:00:00Z",
+            "title": "Error Paper",
+            "downloaded": True, "summarized": True,
+            "tag": "security", "one_liner": "Something.",
+            "emoji": "🛡️", "points": ["A"],
+        })
+        classifier = MagicMock()
+        classifier.chat.completions.create.side_effect = Exception("API down")
+        classify_relevance(
+            records=tmp_db.find(summarized=True),
+            classifier=classifier,
+            relevance_prompt="test",
+            paper_db=tmp_db,
+        )
+        assert tmp_db.find()[0]["relevant"] is True
+
+
+class TestClassifyProjectRelevance:
+
+    def _make_classifier(self, projects):
+        return _StubClient(json.dumps({"projects": projects}))
+
+    def _insert_record(self, tmp_db, record_id="p1"):
+        tmp_db.insert({
+            "id": record_id, "url": "http://x.pdf",
+            "published": "2026-02-15T00:00:00Z",
+            "title": "Jailbreak Attack on LLMs",
+            "downloaded": True, "summarized": True,
+            "tag": "security", "one_liner": "About jailbreaks.",
+            "emoji": "🛡️", "points": ["A"], "relevant": True,
+        })
+
+    def test_matches_valid_projects(self, tmp_db):
+        """LLM returns valid project IDs — stored correctly."""
+        self._insert_record(tmp_db)
+        classify_project_relevance(
+            records=tmp_db.find(summarized=True),
+            classifier=self._make_classifier(["proj-alpha", "proj-beta"]),
+            prompt="test",
+            project_ids=["proj-alpha", "proj-beta", "proj-gamma"],
+            paper_db=tmp_db,
+        )
+        assert tmp_db.find()[0]["projects"] == ["proj-alpha", "proj-beta"]
+
+    def test_no_matches_returns_empty(self, tmp_db):
+        """LLM returns no matches — stored as empty list."""
+        self._insert_record(tmp_db)
+        classify_project_relevance(
+            records=tmp_db.find(summarized=True),
+            classifier=self._make_classifier([]),
+            prompt="test",
+            project_ids=["proj-alpha"],
+            paper_db=tmp_db,
+        )
+        assert tmp_db.find()[0]["projects"] == []
+
+    def test_strips_hallucinated_ids(self, tmp_db):
+        """LLM returns unknown project IDs — hallucinated IDs are stripped."""
+        self._insert_record(tmp_db)
+        classify_project_relevance(
+            records=tmp_db.find(summarized=True),
+            classifier=self._make_classifier(["proj-alpha", "hallucinated-proj"]),
+            prompt="test",
+            project_ids=["proj-alpha", "proj-beta"],
+            paper_db=tmp_db,
+        )
+        assert tmp_db.find()[0]["projects"] == ["proj-alpha"]
+
+    def test_skips_already_classified(self, tmp_db):
+        """Records with 'projects' already set are not re-classified."""
+        self._insert_record(tmp_db)
+        tmp_db.update("p1", {"projects": ["proj-alpha"]})
+        classifier = MagicMock()
+        classify_project_relevance(
+            records=tmp_db.find(summarized=True),
+            classifier=classifier,
+            prompt="test",
+            project_ids=["proj-alpha"],
+            paper_db=tmp_db,
+        )
+        classifier.chat.completions.create.assert_not_called()
+
+    def test_defaults_to_empty_on_error(self, tmp_db):
+        """On LLM error, paper gets empty projects list."""
+        self._insert_record(tmp_db)
+        classifier = MagicMock()
+        classifier.chat.completions.create.side_effect = Exception("API down")
+        classify_project_relevance(
+            records=tmp_db.find(summarized=True),
+            classifier=classifier,
+            prompt="test",
+            project_ids=["proj-alpha"],
+            paper_db=tmp_db,
+        )
+        assert tmp_db.find()[0]["projects"] == []
+
+
+# ---------------------------------------------------------------------------
+# Author/affiliation validation
+# ---------------------------------------------------------------------------
+
+
+class TestValidateAffiliations:
+
+    def test_keeps_affiliations_when_authors_match(self):
+        """Affiliations are kept when arXiv authors appear in PDF text."""
+        affiliations = ["MIT", "Stanford"]
+        authors = ["Alice Smith", "Bob Jones"]
+        pdf_text = "Alice Smith and Bob Jones from MIT and Stanford..."
+        result = _validate_affiliations(affiliations, _last_names(authors), _title_page(pdf_text), "test")
+        assert result == ["MIT", "Stanford"]
+
+    def test_discards_affiliations_when_authors_dont_match(self):
+        """Affiliations are discarded when arXiv authors are not in the PDF."""
+        affiliations = ["MIT", "Stanford"]
+        authors = ["Alice Smith", "Bob Jones"]
+        pdf_text = "Completely unrelated text with no author names at all..."
+        result = _validate_affiliations(affiliations, _last_names(authors), _title_page(pdf_text), "test")
+        assert result == []
+
+    def test_partial_match_above_threshold(self):
+        """At least 50% of authors matching keeps the affiliations."""
+        affiliations = ["MIT"]
+        authors = ["Alice Smith", "Bob Jones"]
+        # Only Smith appears
+        pdf_text = "Smith et al. present a study on LLM security..."
+        result = _validate_affiliations(affiliations, _last_names(authors), _title_page(pdf_text), "test")
+        assert result == ["MIT"]
+
+    def test_partial_match_below_threshold(self):
+        """Below 50% match discards affiliations."""
+        affiliations = ["MIT"]
+        authors = ["Alice Smith", "Bob Jones", "Charlie Brown"]
+        # Only Smith appears (1/3 = 33%)
+        pdf_text = "Smith et al. present a study on LLM security..."
+        result = _validate_affiliations(affiliations, _last_names(authors), _title_page(pdf_text), "test")
+        assert result == []
+
+    def test_match_is_case_insensitive(self):
+        """Case-folding matches names regardless of capitalization or ß/SS."""
+        affiliations = ["TU Munich"]
+        authors = ["Johann Strauß", "Anna Weiß"]
+        pdf_text = "JOHANN STRAUSS and ANNA WEISS, TU Munich"
+        result = _validate_affiliations(affiliations, _last_names(authors), _title_page(pdf_text), "test")
+        assert result == ["TU Munich"]
+
+    def test_only_title_page_is_checked(self):
+        """Names appearing only after the first ~3000 chars don't count."""
+        affiliations = ["MIT"]
+        authors = ["Alice Smith"]
+        pdf_text = "x" * 3000 + " Alice Smith"
+        result = _validate_affiliations(affiliations, _last_names(authors), _title_page(pdf_text), "test")
+        assert result == []
+
+    def test_empty_authors_returns_affiliations_unchanged(self):
+        """If no arXiv authors, skip validation and return affiliations as-is."""
+        affiliations = ["MIT"]
+        result = _validate_affiliations(affiliations, _last_names([]), _title_page("any text"), "test")
+        assert result == ["MIT"]
+
+    def test_empty_affiliations_returns_empty(self):
+        """Empty affiliations stay empty regardless of authors."""
+        result = _validate_affiliations([], _last_names(["Alice Smith"]), _title_page("Alice Smith..."), "test")
+        assert result == []
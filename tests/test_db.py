@@ -1,6 +1,8 @@
 """Tests for secnews.utils_db — PaperDB and date normalization."""
 
 import json
+from unittest.mock import patch
+
 import pytest
 from secnews.utils_db import PaperDB, _normalize_date
 
@@ -19,6 +21,9 @@ class TestNormalizeDate:
     def test_plus_zero_offset(self):
         assert _normalize_date("2025-05-01T00:00:00+00:00") == "2025-05-01T00:00:00Z"
 
+    def test_fractional_seconds_use_full_parser(self):
+        assert _normalize_date("2025-05-01T00:00:00.5Z") == "2025-05-01T00:00:00Z"
+
     def test_positive_offset_converts_to_utc(self):
         # 03:00 at +03:00 is midnight UTC
         assert _normalize_date("2025-05-01T03:00:00+03:00") == "2025-05-01T00:00:00Z"
@@ -28,7 +33,7 @@ class TestNormalizeDate:
         assert _normalize_date("2025-04-30T21:00:00-03:00") == "2025-05-01T00:00:00Z"
 
     def test_consistent_with_search_normalize(self):
-        """Guard against drift between the two duplicated normalizers."""
+        """Guard against drift between the DB and search normalizers."""
         from secnews.utils_search import _normalize_iso
 
         test_dates = [
@@ -40,6 +45,13 @@ class TestNormalizeDate:
         for d in test_dates:
             assert _normalize_date(d) == _normalize_iso(d), f"Mismatch for {d}"
 
+    def test_single_shared_implementation(self):
+        from secnews.utils_dates import normalize_iso
+        from secnews.utils_search import _normalize_iso
+
+        assert _normalize_date is normalize_iso
+        assert _normalize_iso is normalize_iso
+
 
 # ---------------------------------------------------------------------------
 # PaperDB — insert / has_url / find / update / persistence
@@ -61,6 +73,31 @@ class TestPaperDBInsert:
         assert tmp_db.has_url("http://example.com/test1.pdf")
         assert not tmp_db.has_url("http://example.com/nope.pdf")
 
+    def test_has_url_after_reopen(self, tmp_path):
+        db_path = str(tmp_path / "urls.json")
+        PaperDB(db_path).insert({
+            "id": "test1",
+            "url": "http://example.com/test1.pdf",
+            "published": "2026-01-15T10:00:00Z",
+            "title": "Test 1",
+            "downloaded": False,
+            "summarized": False,
+        })
+        assert PaperDB(db_path).has_url("http://example.com/test1.pdf")
+
+    def test_has_url_tracks_url_update(self, tmp_db):
+        tmp_db.insert({
+            "id": "test1",
+            "url": "http://example.com/old.pdf",
+            "published": "2026-01-15T10:00:00Z",
+            "title": "Test 1",
+            "downloaded": False,
+            "summarized": False,
+        })
+        tmp_db.update("test1", {"url": "http://example.com/new.pdf"})
+        assert tmp_db.has_url("http://example.com/new.pdf")
+        assert not tmp_db.has_url("http://example.com/old.pdf")
+
     def test_insert_does_not_mutate_caller_dict(self, tmp_db):
         """insert() copies the record — mutating the original must not affect DB."""
         record = {
@@ -87,6 +124,28 @@ class TestPaperDBInsert:
         tmp_db.insert(record)
         assert tmp_db.find()[0]["published"] == "2025-06-15T12:00:00Z"
 
+    def test_insert_many_writes_once(self, tmp_db):
+        records = [
+            {
+                "id": f"m{i}",
+                "url": f"http://example.com/m{i}.pdf",
+                "published": f"2026-01-0{i}T00:00:00+00:00",
+                "title": f"Many {i}",
+                "summarized": False,
+            }
+            for i in (3, 1, 2)
+        ]
+        with patch.object(tmp_db, "_save", wraps=tmp_db._save) as mock_save:
+            assert tmp_db.insert_many(records) == 3
+        mock_save.assert_called_once()
+        assert all(tmp_db.has_url(r["url"]) for r in records)
+        results = tmp_db.find(published_gte="2026-01-02T00:00:00Z", summarized=False)
+        assert [r["id"] for r in results] == ["m2", "m3"]
+
+    def test_insert_many_empty_does_not_write(self, tmp_db):
+        assert tmp_db.insert_many([]) == 0
+        assert not tmp_db.path.exists()
+
 
 class TestPaperDBFind:
 
@@ -134,6 +193,52 @@ class TestPaperDBFind:
         self._populate(tmp_db)
         assert tmp_db.find(published_gte="2027-01-01T00:00:00Z") == []
 
+    def test_find_published_gte_out_of_order_inserts(self, tmp_db):
+        """The date index stays correct when records arrive out of date order."""
+        for day in (20, 5, 15, 10):
+            tmp_db.insert({
+                "id": f"d{day}",
+                "url": f"http://example.com/d{day}.pdf",
+                "published": f"2026-01-{day:02d}T00:00:00Z",
+                "title": f"Day {day}",
+                "downloaded": True,
+                "summarized": False,
+            })
+        results = tmp_db.find(published_gte="2026-01-10T00:00:00Z")
+        assert [r["id"] for r in results] == ["d10", "d15", "d20"]
+
+    def test_find_after_reopen_uses_index(self, tmp_path):
+        """The date index is rebuilt from disk when the DB is reopened."""
+        db_path = str(tmp_path / "reopen.json")
+        self._populate(PaperDB(db_path))
+        results = PaperDB(db_path).find(published_gte="2026-02-01T00:00:00Z")
+        assert {r["id"] for r in results} == {"2026-02", "2026-03"}
+
+    def test_combined_filters_follow_summarized_updates(self, tmp_db):
+        """Marking a record summarized moves it between index buckets."""
+        self._populate(tmp_db)
+        tmp_db.update("2026-01", {"summarized": True})
+        tmp_db.update("2026-03", {"summarized": False})
+        window = "2026-01-01T00:00:00Z"
+        assert [r["id"] for r in tmp_db.find(published_gte=window, summarized=True)] == [
+            "2026-01", "2026-02",
+        ]
+        assert [r["id"] for r in tmp_db.find(published_gte=window, summarized=False)] == [
+            "2026-03",
+        ]
+
+    def test_combined_filters_missing_summarized_key(self, tmp_db):
+        """Records without a summarized key match neither True nor False."""
+        tmp_db.insert({
+            "id": "bare",
+            "url": "http://example.com/bare.pdf",
+            "published": "2026-01-10T00:00:00Z",
+            "title": "Bare",
+        })
+        window = "2026-01-01T00:00:00Z"
+        assert tmp_db.find(published_gte=window, summarized=True) == []
+        assert tmp_db.find(published_gte=window, summarized=False) == []
+
 
 class TestPaperDBUpdate:
 
@@ -231,6 +336,14 @@ class TestPaperDBResetSummarized:
         assert old["summarized"] is True
         assert old["emoji"] == "📄"
 
+    def test_reset_records_are_found_as_unsummarized(self, tmp_db):
+        self._populate(tmp_db)
+        tmp_db.reset_summarized("2026-02-01T00:00:00Z")
+        window = "2026-02-01T00:00:00Z"
+        ids = {r["id"] for r in tmp_db.find(published_gte=window, summarized=False)}
+        assert ids == {"new-summ", "new-unsumm"}
+        assert tmp_db.find(published_gte=window, summarized=True) == []
+
     def test_returns_zero_when_nothing_to_reset(self, tmp_db):
         self._populate(tmp_db)
         count = tmp_db.reset_summarized("2027-01-01T00:00:00Z")
@@ -274,3 +387,79 @@ class TestPaperDBPersistence:
         assert db_path.exists()
         data = json.loads(db_path.read_text())
         assert len(data) == 1
+
+    def test_save_leaves_no_temp_file(self, tmp_path):
+        db = PaperDB(str(tmp_path / "atomic.json"))
+        db.insert({
+            "id": "x",
+            "url": "http://example.com/x.pdf",
+            "published": "2026-01-01T00:00:00Z",
+            "title": "X",
+            "downloaded": False,
+            "summarized": False,
+        })
+        assert [p.name for p in tmp_path.iterdir()] == ["atomic.json"]
+
+    def test_round_trip_non_ascii(self, tmp_path):
+        db_path = str(tmp_path / "utf8.json")
+        PaperDB(db_path).insert({
+            "id": "u",
+            "url": "http://example.com/u.pdf",
+            "published": "2026-01-01T00:00:00Z",
+            "title": "Müller’s attack 🛡️",
+            "downloaded": False,
+            "summarized": False,
+        })
+        assert PaperDB(db_path).find()[0]["title"] == "Müller’s attack 🛡️"
+
+
+class TestPaperDBBatching:
+
+    def _record(self, paper_id):
+        return {
+            "id": paper_id,
+            "url": f"http://example.com/{paper_id}.pdf",
+            "published": "2026-01-01T00:00:00Z",
+            "title": paper_id,
+            "downloaded": False,
+            "summarized": False,
+        }
+
+    def test_writes_deferred_until_block_exits(self, tmp_path):
+        db_path = tmp_path / "batch.json"
+        db = PaperDB(str(db_path))
+        with db:
+            db.insert(self._record("a"))
+            db.insert(self._record("b"))
+            db.update("a", {"downloaded": True})
+            assert not db_path.exists()
+            # Reads see the pending in-memory state
+            assert len(db.find()) == 2
+        assert len(json.loads(db_path.read_text())) == 2
+        assert PaperDB(str(db_path)).find()[0]["downloaded"] is True
+
+    def test_nested_blocks_flush_once_at_outermost_exit(self, tmp_path):
+        db_path = tmp_path / "nested.json"
+        db = PaperDB(str(db_path))
+        with db:
+            with db:
+                db.insert(self._record("a"))
+            assert not db_path.exists()
+        assert db_path.exists()
+
+    def test_flushes_completed_work_when_block_raises(self, tmp_path):
+        db_path = tmp_path / "raise.json"
+        db = PaperDB(str(db_path))
+        with pytest.raises(RuntimeError):
+            with db:
+                db.insert(self._record("a"))
+                raise RuntimeError("boom")
+        assert len(PaperDB(str(db_path)).find()) == 1
+
+    def test_explicit_flush(self, tmp_path):
+        db_path = tmp_path / "flush.json"
+        db = PaperDB(str(db_path))
+        with db:
+            db.insert(self._record("a"))
+            db.flush()
+            assert db_path.exists()
@@ -1,16 +1,25 @@
 """Tests for secnews.utils_papers — filename extraction, PDF reading, downloads."""
 
 import os
+import sys
+import threading
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
 from unittest.mock import patch, MagicMock
 
 import pytest
 
 from secnews.utils_papers import (
+    _PDFIUM_LOCK,
+    _fetch_one,
+    _request_bulk,
     _filename_from_url,
     _save,
     download_papers,
     assemble_records,
     read_pages,
+    read_pdf,
 )
 
 
@@ -76,6 +85,117 @@ class TestReadPages:
         assert len(matches) >= 2, f"Expected academic keywords, found only: {matches}"
 
 
+# ---------------------------------------------------------------------------
+# read_pdf — real PDF
+# ---------------------------------------------------------------------------
+
+
+class TestReadPdf:
+
+    def test_reads_real_pdf(self, real_paper_path, real_pdf_id):
+        result = read_pdf(os.path.join(real_paper_path, f"{real_pdf_id}.pdf"))
+        assert result["pages"] > 0
+        assert len(result["content"]) > 100
+        assert result["characters"] == len(result["content"])
+
+    def test_max_pages_limits_pages_read(self, real_paper_path, real_pdf_id):
+        result = read_pdf(os.path.join(real_paper_path, f"{real_pdf_id}.pdf"), max_pages=1)
+        assert result["pages"] == 1
+
+    def test_pypdfium2_extracts_text(self, real_paper_path, real_pdf_id):
+        """The PDFium branch returns the page text without any warnings."""
+        pytest.importorskip("pypdfium2")
+        path = os.path.join(real_paper_path, f"{real_pdf_id}.pdf")
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            result = read_pdf(path, max_pages=1)
+        assert result["pages"] == 1
+        assert "Adversarial Attacks on Language Model Agents" in result["content"]
+        assert "Alice Smith, Bob Jones" in result["content"]
+
+    def test_concurrent_reads_match_serial_read(self, real_paper_path, real_pdf_id):
+        """Reading the same PDF on many threads at once gives the serial result."""
+        path = os.path.join(real_paper_path, f"{real_pdf_id}.pdf")
+        expected = read_pdf(path)
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda _: read_pdf(path), range(32)))
+        assert all(result == expected for result in results)
+
+    def test_pdfium_opened_under_lock(self, real_paper_path, real_pdf_id):
+        pdfium = pytest.importorskip("pypdfium2")
+        real_document = pdfium.PdfDocument
+        held = []
+
+        def document(path):
+            held.append(_PDFIUM_LOCK.locked())
+            return real_document(path)
+
+        with patch.object(pdfium, "PdfDocument", document):
+            read_pdf(os.path.join(real_paper_path, f"{real_pdf_id}.pdf"))
+        assert held == [True]
+        assert not _PDFIUM_LOCK.locked()
+
+    def test_falls_back_to_pypdf(self, real_paper_path, real_pdf_id):
+        """Without pypdfium2, read_pdf goes through read_pages over a PdfReader."""
+        path = os.path.join(real_paper_path, f"{real_pdf_id}.pdf")
+        with patch.dict(sys.modules, {"pypdfium2": None}), patch(
+            "secnews.utils_papers.read_pages", wraps=read_pages
+        ) as mock_read_pages:
+            result = read_pdf(path, max_pages=1)
+        mock_read_pages.assert_called_once()
+        assert mock_read_pages.call_args.args[1] == 1
+        assert result["pages"] == 1
+        assert "Adversarial Attacks on Language Model Agents" in result["content"]
+
+    def test_corrupt_pdf_raises(self, tmp_path):
+        path = tmp_path / "corrupt.pdf"
+        path.write_bytes(b"not a pdf")
+        with pytest.raises(Exception):
+            read_pdf(str(path))
+
+
+# ---------------------------------------------------------------------------
+# _request_bulk — mocked session
+# ---------------------------------------------------------------------------
+
+
+class TestRequestBulk:
+
+    def test_empty_urls_issue_no_requests(self):
+        with patch("secnews.utils_papers._fetch_one") as mock_fetch:
+            assert list(_request_bulk([])) == []
+        mock_fetch.assert_not_called()
+
+    def test_yields_responses_and_skips_failures(self):
+        ok = SimpleNamespace(url="http://arxiv.org/pdf/2601.00001v1.pdf")
+
+        def fake_fetch(session, url, paper_path=None):
+            if url.endswith("00002v1.pdf"):
+                raise ConnectionError("reset")
+            return ok
+
+        with patch("secnews.utils_papers._fetch_one", side_effect=fake_fetch) as mock_fetch:
+            responses = list(_request_bulk([
+                "http://arxiv.org/pdf/2601.00001v1.pdf",
+                "http://arxiv.org/pdf/2601.00002v1.pdf",
+            ]))
+        assert responses == [ok]
+        assert mock_fetch.call_count == 2
+
+    def test_fetches_run_concurrently(self):
+        """All workers must be in flight at once for the barrier to release."""
+        urls = [f"http://arxiv.org/pdf/2601.0000{i}v1.pdf" for i in range(4)]
+        barrier = threading.Barrier(len(urls), timeout=5)
+
+        def fake_fetch(session, url, paper_path=None):
+            barrier.wait()
+            return SimpleNamespace(url=url)
+
+        with patch("secnews.utils_papers._fetch_one", side_effect=fake_fetch):
+            responses = list(_request_bulk(urls, max_workers=len(urls)))
+        assert sorted(r.url for r in responses) == urls
+
+
 # ---------------------------------------------------------------------------
 # download_papers — mocked HTTP
 # ---------------------------------------------------------------------------
@@ -102,7 +222,7 @@ class TestDownloadPapers:
         mock_response = MagicMock()
         mock_response.url = "http://arxiv.org/pdf/2601.00001v1.pdf"
         mock_response.content = b"%PDF-fake"
-        mock_bulk.return_value = [mock_response]
+        mock_bulk.return_value = iter([mock_response])
 
         results = [{"url": "http://arxiv.org/pdf/2601.00001v1.pdf"}]
         download_papers(results=results, paper_db=tmp_db, paper_path=paper_path)
@@ -116,7 +236,7 @@ class TestDownloadPapers:
     @patch("secnews.utils_papers._request_bulk")
     def test_deduplicates_urls(self, mock_bulk, tmp_path, tmp_db):
         """Duplicate URLs in results should only be downloaded once."""
-        mock_bulk.return_value = []
+        mock_bulk.return_value = iter([])
         results = [
             {"url": "http://arxiv.org/pdf/2601.00001v1.pdf"},
             {"url": "http://arxiv.org/pdf/2601.00001v1.pdf"},
@@ -127,6 +247,63 @@ class TestDownloadPapers:
         assert len(urls_arg) == 1
 
 
+class TestStreamingDownload:
+
+    @staticmethod
+    def _streaming_response(url, chunks):
+        # spec'd so that touching .content (a buffered read) fails the test
+        response = MagicMock(spec=["url", "iter_content", "close"])
+        response.url = url
+        response.iter_content.return_value = iter(chunks)
+        return response
+
+    def test_fetch_one_streams_chunks_to_disk(self, tmp_path):
+        url = "http://arxiv.org/pdf/2601.00001v1.pdf"
+        session = MagicMock()
+        session.get.return_value = self._streaming_response(url, [b"%PDF-", b"body"])
+
+        _fetch_one(session, url, paper_path=str(tmp_path))
+
+        assert session.get.call_args.kwargs["stream"] is True
+        assert (tmp_path / "2601.00001v1.pdf").read_bytes() == b"%PDF-body"
+        assert not (tmp_path / "2601.00001v1.pdf.part").exists()
+        session.get.return_value.close.assert_called_once()
+
+    def test_interrupted_stream_leaves_no_file(self, tmp_path):
+        def broken_body():
+            yield b"%PDF-"
+            raise ConnectionError("reset")
+
+        url = "http://arxiv.org/pdf/2601.00001v1.pdf"
+        session = MagicMock()
+        session.get.return_value = self._streaming_response(url, broken_body())
+
+        with pytest.raises(ConnectionError):
+            _fetch_one(session, url, paper_path=str(tmp_path))
+        assert list(tmp_path.iterdir()) == []
+
+    def test_download_papers_stream_updates_db(self, tmp_path, tmp_db):
+        url = "http://arxiv.org/pdf/2601.00001v1.pdf"
+        tmp_db.insert({
+            "id": "2601.00001v1",
+            "url": url,
+            "published": "2026-01-15T00:00:00Z",
+            "title": "Test",
+            "downloaded": False,
+            "summarized": False,
+        })
+        session = MagicMock()
+        session.get.return_value = self._streaming_response(url, [b"%PDF-", b"body"])
+        with patch("secnews.utils_papers.requests.Session") as mock_session_cls:
+            mock_session_cls.return_value.__enter__.return_value = session
+            download_papers(
+                results=[{"url": url}], paper_db=tmp_db, paper_path=str(tmp_path), stream=True
+            )
+
+        assert (tmp_path / "2601.00001v1.pdf").read_bytes() == b"%PDF-body"
+        assert tmp_db.find()[0]["downloaded"] is True
+
+
 # ---------------------------------------------------------------------------
 # assemble_records
 # ---------------------------------------------------------------------------
@@ -4,6 +4,7 @@ import os
 import json
 import shutil
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import patch, MagicMock
 
 import pytest
@@ -15,6 +16,9 @@ from secnews.utils_summary import summarize_records, classify_relevance
 from secnews.utils_comms import share_results
 from tests.conftest import SAMPLE_ARXIV_FEED, PAPERS_DIR, REAL_PDF_ID
 
+# Keep the opt-in LLM response cache off and out of ~/.cache
+pytestmark = pytest.mark.usefixtures("isolated_llm_cache")
+
 
 MOCK_LLM_RESPONSE = {
     "findings": ["F1", "F2", "F3"],
@@ -22,13 +26,33 @@ MOCK_LLM_RESPONSE = {
     "emoji": "🧪",
     "tag": "security",
 }
+_MOCK_LLM_JSON = json.dumps(MOCK_LLM_RESPONSE)
+_RELEVANT_JSON = json.dumps({"relevant": True})
+
+# Minimal stand-in for a successful arXiv API response
+FAKE_SEARCH_RESPONSE = SimpleNamespace(content=SAMPLE_ARXIV_FEED, status_code=200)
+
+
+def _mk_llm_mock(content):
+    """Mock Azure OpenAI client whose completions return *content* (a JSON string)."""
+    client = MagicMock()
+    client.chat.completions.create.return_value.choices = [
+        MagicMock(message=MagicMock(content=content))
+    ]
+    return client
+
+
+@pytest.fixture(scope="module")
+def real_pdf_bytes():
+    """Bytes of the real PDF used as mock download content, read once per module."""
+    return (Path(PAPERS_DIR) / f"{REAL_PDF_ID}.pdf").read_bytes()
 
 
 class TestFullPipeline:
 
     @patch("secnews.utils_papers._request_bulk")
-    @patch("secnews.utils_search.requests.get")
-    def test_end_to_end(self, mock_search_get, mock_bulk_dl, tmp_path):
+    @patch("secnews.utils_search._SESSION.get")
+    def test_end_to_end(self, mock_search_get, mock_bulk_dl, tmp_path, real_pdf_bytes):
         """Run the full pipeline with mocked arXiv search, mocked PDF download,
         and mocked LLM — verify DB state and markdown output at the end."""
 
@@ -43,9 +67,7 @@ class TestFullPipeline:
         pull_window = "2026-01-10T00:00:00Z"
 
         # --- Mock arXiv search ---
-        mock_response = MagicMock()
-        mock_response.content = SAMPLE_ARXIV_FEED
-        mock_search_get.return_value = mock_response
+        mock_search_get.return_value = FAKE_SEARCH_RESPONSE
 
         # --- Step 1: Search ---
         params = [{"search_query": "test_query", "start": 0, "max_results": 200}]
@@ -65,21 +87,11 @@ class TestFullPipeline:
         )
         assert len(valid) == 2  # both are recent and not on disk
 
-        # --- Step 4: Download (mocked) ---
-        # Read a real PDF's bytes to use as mock content
-        real_pdf_bytes = open(
-            os.path.join(PAPERS_DIR, f"{REAL_PDF_ID}.pdf"), "rb"
-        ).read()
-
-        mock_resp_1 = MagicMock()
-        mock_resp_1.url = "http://arxiv.org/pdf/2601.00001v1.pdf"
-        mock_resp_1.content = real_pdf_bytes
-
-        mock_resp_2 = MagicMock()
-        mock_resp_2.url = "http://arxiv.org/pdf/2601.00002v1.pdf"
-        mock_resp_2.content = real_pdf_bytes
-
-        mock_bulk_dl.return_value = [mock_resp_1, mock_resp_2]
+        # --- Step 4: Download (mocked, real PDF bytes as content) ---
+        mock_bulk_dl.return_value = (
+            SimpleNamespace(url=f"http://arxiv.org/pdf/{paper_id}.pdf", content=real_pdf_bytes)
+            for paper_id in ("2601.00001v1", "2601.00002v1")
+        )
 
         download_papers(results=valid, paper_db=paper_db, paper_path=paper_path)
 
@@ -91,13 +103,7 @@ class TestFullPipeline:
         assert len(records) == 2  # both downloaded, not yet summarized
 
         # --- Step 6: Summarize (mocked LLM) ---
-        summarizer = MagicMock()
-        mock_choice = MagicMock()
-        mock_choice.message.content = json.dumps(MOCK_LLM_RESPONSE)
-        mock_result = MagicMock()
-        mock_result.choices = [mock_choice]
-        summarizer.chat.completions.create.return_value = mock_result
-
+        summarizer = _mk_llm_mock(_MOCK_LLM_JSON)
         summarize_records(
             records=records,
             summarizer=summarizer,
@@ -113,16 +119,9 @@ class TestFullPipeline:
             assert rec["points"] == ["F1", "F2", "F3"]
 
         # --- Step 6b: Classify relevance ---
-        relevance_resp = MagicMock()
-        rel_choice = MagicMock()
-        rel_choice.message.content = json.dumps({"relevant": True})
-        rel_result = MagicMock()
-        rel_result.choices = [rel_choice]
-        relevance_resp.chat.completions.create.return_value = rel_result
-
         classify_relevance(
             records=paper_db.find(summarized=True),
-            classifier=relevance_resp,
+            classifier=_mk_llm_mock(_RELEVANT_JSON),
             relevance_prompt="test",
             paper_db=paper_db,
         )
@@ -151,7 +150,7 @@ class TestFullPipeline:
             assert rec["downloaded"] is True
             assert rec["summarized"] is True
 
-    @patch("secnews.utils_search.requests.get")
+    @patch("secnews.utils_search._SESSION.get")
     def test_rerun_skips_existing_papers(self, mock_search_get, tmp_path):
         """A second run with the same data should not re-process anything."""
         db_path = str(tmp_path / "papers.json")
@@ -161,9 +160,7 @@ class TestFullPipeline:
 
         paper_db = PaperDB(db_path)
 
-        mock_response = MagicMock()
-        mock_response.content = SAMPLE_ARXIV_FEED
-        mock_search_get.return_value = mock_response
+        mock_search_get.return_value = FAKE_SEARCH_RESPONSE
 
         # First run: populate DB
         params = [{"search_query": "q", "start": 0, "max_results": 200}]
@@ -2,7 +2,8 @@
 
 import json
 import os
-from unittest.mock import patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
 
@@ -16,6 +17,9 @@ from secnews.utils_search import (
 )
 from tests.conftest import SAMPLE_ARXIV_FEED
 
+# Minimal stand-in for a successful arXiv API response
+FAKE_RESPONSE = SimpleNamespace(content=SAMPLE_ARXIV_FEED, status_code=200)
+
 
 # ---------------------------------------------------------------------------
 # Search state persistence
@@ -42,10 +46,16 @@ class TestSearchState:
 
 class TestSearchCaching:
 
+    @pytest.fixture(autouse=True)
+    def no_politeness_delay(self):
+        """Skip the 2-4 s arXiv politeness sleep before each request."""
+        with patch("secnews.utils_search.time.sleep"):
+            yield
+
     def _make_params(self, query):
         return [{"search_query": query, "start": 0, "max_results": 10}]
 
-    @patch("secnews.utils_search.requests.get")
+    @patch("secnews.utils_search._SESSION.get")
     def test_fresh_cache_skips_search(self, mock_get, tmp_path):
         """A recently completed search should be skipped (no HTTP call)."""
         state_path = str(tmp_path / "state.json")
@@ -62,16 +72,14 @@ class TestSearchCaching:
         mock_get.assert_not_called()
         assert results == []
 
-    @patch("secnews.utils_search.requests.get")
+    @patch("secnews.utils_search._SESSION.get")
     def test_stale_cache_executes_search(self, mock_get, tmp_path):
         """A stale cache entry should trigger a real search."""
         state_path = str(tmp_path / "state.json")
         _save_search_state(
             {"test_query": "2020-01-01T00:00:00Z"}, state_path
         )
-        mock_response = MagicMock()
-        mock_response.content = SAMPLE_ARXIV_FEED
-        mock_get.return_value = mock_response
+        mock_get.return_value = FAKE_RESPONSE
 
         results = execute_searches(
             base="http://fake",
@@ -82,16 +90,14 @@ class TestSearchCaching:
         mock_get.assert_called_once()
         assert len(results) == 1  # one feed batch
 
-    @patch("secnews.utils_search.requests.get")
+    @patch("secnews.utils_search._SESSION.get")
     def test_force_ignores_fresh_cache(self, mock_get, tmp_path):
         """force=True should execute even if cache is fresh."""
         state_path = str(tmp_path / "state.json")
         _save_search_state(
             {"test_query": "2099-01-01T00:00:00Z"}, state_path
         )
-        mock_response = MagicMock()
-        mock_response.content = SAMPLE_ARXIV_FEED
-        mock_get.return_value = mock_response
+        mock_get.return_value = FAKE_RESPONSE
 
         results = execute_searches(
             base="http://fake",
@@ -103,17 +109,14 @@ class TestSearchCaching:
         mock_get.assert_called_once()
         assert len(results) == 1
 
-    @patch("secnews.utils_search.requests.get")
+    @patch("secnews.utils_search._SESSION.get")
     def test_state_saved_per_query_for_resumability(self, mock_get, tmp_path):
         """State is saved after each successful query. If a later query fails,
         earlier queries are still recorded in the state file."""
         state_path = str(tmp_path / "state.json")
 
-        ok_response = MagicMock()
-        ok_response.content = SAMPLE_ARXIV_FEED
-
         # First call succeeds, second raises
-        mock_get.side_effect = [ok_response, ConnectionError("arXiv down")]
+        mock_get.side_effect = [FAKE_RESPONSE, ConnectionError("arXiv down")]
 
         params = [
             {"search_query": "query_1", "start": 0, "max_results": 10},
@@ -151,8 +154,12 @@ class TestProcessFeed:
         assert results[0]["downloaded"] is False
         assert results[0]["summarized"] is False
 
-        # Second entry has one author
+        # Abstract is captured with whitespace collapsed
+        assert results[0]["abstract"] == "We study jailbreak attacks on large language models."
+
+        # Second entry has one author and no abstract
         assert results[1]["authors"] == ["Charlie Brown"]
+        assert results[1]["abstract"] == ""
 
         # Both inserted into DB
         assert tmp_db.has_url("http://arxiv.org/pdf/2601.00001v1.pdf")
@@ -164,6 +171,15 @@ class TestProcessFeed:
         process_feed(SAMPLE_ARXIV_FEED, tmp_db)
         assert len(tmp_db.find()) == 2
 
+    def test_repeated_entry_within_feed_inserted_once(self, tmp_db):
+        first_entry = SAMPLE_ARXIV_FEED[
+            SAMPLE_ARXIV_FEED.index(b"<entry>"):SAMPLE_ARXIV_FEED.index(b"</entry>") + 8
+        ]
+        payload = SAMPLE_ARXIV_FEED.replace(b"</feed>", first_entry + b"</feed>")
+        results = process_feed(payload, tmp_db)
+        assert len(results) == 3
+        assert len(tmp_db.find()) == 2
+
     def test_url_construction_no_double_pdf(self, tmp_db):
         """URL should end in .pdf exactly once."""
         results = process_feed(SAMPLE_ARXIV_FEED, tmp_db)
@@ -183,6 +199,13 @@ class TestAssembleFeeds:
         assert len(urls) == len(set(urls))
         assert len(results) == 2  # 2 unique entries
 
+    def test_writes_db_once_for_all_feeds(self, tmp_db):
+        other_feed = SAMPLE_ARXIV_FEED.replace(b"2601.0000", b"2601.0009")
+        with patch.object(tmp_db, "_save", wraps=tmp_db._save) as mock_save:
+            assemble_feeds(feeds=[SAMPLE_ARXIV_FEED, other_feed], paper_db=tmp_db)
+        mock_save.assert_called_once()
+        assert len(tmp_db.find()) == 4
+
 
 # ---------------------------------------------------------------------------
 # Pruning
@@ -220,6 +243,14 @@ class TestPruneFeeds:
         assert len(valid) == 1
         assert valid[0]["id"] == "missing"
 
+    def test_directory_named_like_pdf_not_treated_as_downloaded(self, tmp_path):
+        (tmp_path / "odd.pdf").mkdir()
+        feeds = [{"id": "odd", "published": "2026-02-15T00:00:00Z"}]
+        valid = prune_feeds(
+            feeds=feeds, pull_window="2026-02-01T00:00:00Z", paper_path=str(tmp_path)
+        )
+        assert [f["id"] for f in valid] == ["odd"]
+
     def test_boundary_date_included(self):
         """A paper published exactly at the pull_window should be included."""
         feeds = [{"id": "boundary", "published": "2026-02-01T00:00:00Z"}]
@@ -3,12 +3,18 @@
 import os
 import json
 import shutil
+import threading
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from secnews.utils_summary import summarize_records, _validate_affiliations, classify_relevance, classify_project_relevance
-from tests.conftest import REAL_PDF_ID, PAPERS_DIR
+from secnews import utils_papers, utils_summary
+from secnews.utils_summary import summarize_records, _chat_json
+from tests.conftest import PAPERS_DIR, REAL_PDF_ID, _StubClient
+
+# Keep the opt-in LLM response cache off and out of ~/.cache
+pytestmark = pytest.mark.usefixtures("isolated_llm_cache")
 
 
 # ---------------------------------------------------------------------------
@@ -16,15 +22,30 @@ from tests.conftest import REAL_PDF_ID, PAPERS_DIR
 # ---------------------------------------------------------------------------
 
 
-def _make_mock_summarizer(response_json):
-    """Create a mock Azure OpenAI client that returns the given JSON dict."""
+def _touch_pdf(paper_path, paper_id=REAL_PDF_ID):
+    """Create an empty placeholder ``<paper_id>.pdf`` in *paper_path*."""
+    open(os.path.join(paper_path, f"{paper_id}.pdf"), "wb").close()
+
+
+@pytest.fixture
+def summarizer_factory():
+    """Factory for a mock Azure OpenAI client that returns the given JSON payload.
+
+    The client and its response chain are built once per test; each call only
+    swaps the message content.
+    """
     summarizer = MagicMock()
-    mock_choice = MagicMock()
-    mock_choice.message.content = json.dumps(response_json)
-    mock_result = MagicMock()
-    mock_result.choices = [mock_choice]
-    summarizer.chat.completions.create.return_value = mock_result
-    return summarizer
+    message = SimpleNamespace(content="")
+    summarizer.chat.completions.create.return_value = SimpleNamespace(
+        choices=[SimpleNamespace(message=message)]
+    )
+
+    def make(response):
+        # Accept a pre-serialized JSON string to skip re-encoding constants
+        message.content = response if isinstance(response, str) else json.dumps(response)
+        return summarizer
+
+    return make
 
 
 VALID_LLM_RESPONSE = {
@@ -39,6 +60,10 @@ VALID_LLM_RESPONSE = {
     "affiliations": ["MIT", "Stanford University"],
     "interest_score": 8,
 }
+VALID_LLM_RESPONSE_JSON = json.dumps(VALID_LLM_RESPONSE)
+
+# Text returned in place of parsing a PDF in the mocked tests
+STUB_PDF_TEXT = "Alice Smith and Bob Jones from MIT and Stanford. Body text."
 
 
 # ---------------------------------------------------------------------------
@@ -48,13 +73,25 @@ VALID_LLM_RESPONSE = {
 
 class TestSummarizeRecordsMocked:
 
-    def test_happy_path(self, tmp_path, tmp_db):
-        """With a real PDF and mocked LLM, the record is correctly summarized."""
+    @pytest.fixture(autouse=True)
+    def stub_read_pdf(self, monkeypatch):
+        """Return canned text for any PDF on disk instead of parsing it.
+
+        These tests cover summarize_records' control flow, so the placeholder
+        files they create only need to exist; a missing file still raises.
+        """
+        def read_pdf(path, max_pages=None):
+            if not os.path.isfile(path):
+                raise FileNotFoundError(path)
+            return {"pages": 1, "content": STUB_PDF_TEXT, "characters": len(STUB_PDF_TEXT)}
+
+        monkeypatch.setattr(utils_summary, "read_pdf", read_pdf)
+
+    def test_happy_path(self, tmp_path, tmp_db, summarizer_factory):
+        """With a PDF on disk and mocked LLM, the record is correctly summarized."""
         paper_path = str(tmp_path / "papers")
         os.makedirs(paper_path)
-        # Copy a real PDF into tmp
-        src = os.path.join(PAPERS_DIR, f"{REAL_PDF_ID}.pdf")
-        shutil.copy(src, os.path.join(paper_path, f"{REAL_PDF_ID}.pdf"))
+        _touch_pdf(paper_path)
 
         tmp_db.insert({
             "id": REAL_PDF_ID,
@@ -66,7 +103,7 @@ class TestSummarizeRecordsMocked:
             "summarized": False,
         })
 
-        summarizer = _make_mock_summarizer(VALID_LLM_RESPONSE)
+        summarizer = summarizer_factory(VALID_LLM_RESPONSE_JSON)
         summarize_records(
             records=tmp_db.find(summarized=False),
             summarizer=summarizer,
@@ -85,14 +122,13 @@ class TestSummarizeRecordsMocked:
         assert rec[0]["affiliations"] == ["MIT", "Stanford University"]
         assert rec[0]["interest_score"] == 8
 
-    def test_missing_emoji_and_tag_get_defaults(self, tmp_path, tmp_db):
+    def test_missing_emoji_and_tag_get_defaults(
+        self, tmp_path, tmp_db, summarizer_factory
+    ):
         """If LLM omits emoji/tag, defaults are applied."""
         paper_path = str(tmp_path / "papers")
         os.makedirs(paper_path)
-        shutil.copy(
-            os.path.join(PAPERS_DIR, f"{REAL_PDF_ID}.pdf"),
-            os.path.join(paper_path, f"{REAL_PDF_ID}.pdf"),
-        )
+        _touch_pdf(paper_path)
         tmp_db.insert({
             "id": REAL_PDF_ID,
             "url": f"http://arxiv.org/pdf/{REAL_PDF_ID}.pdf",
@@ -108,7 +144,7 @@ class TestSummarizeRecordsMocked:
             "findings": ["A", "B", "C"],
             "one_liner": "Interesting paper.",
         }
-        summarizer = _make_mock_summarizer(response)
+        summarizer = summarizer_factory(response)
         summarize_records(
             records=tmp_db.find(summarized=False),
             summarizer=summarizer,
@@ -126,10 +162,7 @@ class TestSummarizeRecordsMocked:
         """If LLM returns invalid JSON, the record is NOT marked summarized."""
         paper_path = str(tmp_path / "papers")
         os.makedirs(paper_path)
-        shutil.copy(
-            os.path.join(PAPERS_DIR, f"{REAL_PDF_ID}.pdf"),
-            os.path.join(paper_path, f"{REAL_PDF_ID}.pdf"),
-        )
+        _touch_pdf(paper_path)
         tmp_db.insert({
             "id": REAL_PDF_ID,
             "url": f"http://arxiv.org/pdf/{REAL_PDF_ID}.pdf",
@@ -140,16 +173,9 @@ class TestSummarizeRecordsMocked:
         })
 
         # Mock returns non-JSON
-        summarizer = MagicMock()
-        mock_choice = MagicMock()
-        mock_choice.message.content = "This is not JSON at all"
-        mock_result = MagicMock()
-        mock_result.choices = [mock_choice]
-        summarizer.chat.completions.create.return_value = mock_result
-
         summarize_records(
             records=tmp_db.find(summarized=False),
-            summarizer=summarizer,
+            summarizer=_StubClient("This is not JSON at all"),
             summarizer_prompt="Test prompt",
             paper_path=paper_path,
             paper_db=tmp_db,
@@ -159,13 +185,14 @@ class TestSummarizeRecordsMocked:
         assert len(tmp_db.find(summarized=True)) == 0
         assert len(tmp_db.find(summarized=False)) == 1
 
-    def test_corrupt_pdf_skips_record(self, tmp_path, tmp_db):
-        """A file with garbage bytes should be skipped, not crash the pipeline."""
+    def test_corrupt_pdf_skips_record(self, tmp_path, tmp_db, monkeypatch, summarizer_factory):
+        """A PDF that fails to parse should be skipped, not crash the pipeline."""
         paper_path = str(tmp_path / "papers")
         os.makedirs(paper_path)
-        # Write garbage
-        with open(os.path.join(paper_path, f"{REAL_PDF_ID}.pdf"), "wb") as f:
-            f.write(b"NOT A PDF AT ALL")
+        _touch_pdf(paper_path)
+        monkeypatch.setattr(
+            utils_summary, "read_pdf", MagicMock(side_effect=Exception("corrupt PDF"))
+        )
 
         tmp_db.insert({
             "id": REAL_PDF_ID,
@@ -176,7 +203,7 @@ class TestSummarizeRecordsMocked:
             "summarized": False,
         })
 
-        summarizer = _make_mock_summarizer(VALID_LLM_RESPONSE)
+        summarizer = summarizer_factory(VALID_LLM_RESPONSE_JSON)
         # Should not raise
         summarize_records(
             records=tmp_db.find(summarized=False),
@@ -188,9 +215,11 @@ class TestSummarizeRecordsMocked:
         # Record should remain unsummarized
         assert len(tmp_db.find(summarized=True)) == 0
 
-    @patch("secnews.utils_summary.download_paper")
-    def test_missing_pdf_triggers_fallback_download(self, mock_dl, tmp_path, tmp_db):
-        """If the PDF doesn't exist, download_paper is called as fallback."""
+    @patch("secnews.utils_summary.download_papers")
+    def test_missing_pdf_triggers_fallback_download(
+        self, mock_dl, tmp_path, tmp_db, summarizer_factory
+    ):
+        """If the PDF doesn't exist, download_papers is called as fallback."""
         paper_path = str(tmp_path / "papers")
         os.makedirs(paper_path)
 
@@ -203,17 +232,15 @@ class TestSummarizeRecordsMocked:
             "summarized": False,
         })
 
-        # Make the fallback download actually place the real PDF
-        def do_download(url, paper_db, pp):
-            shutil.copy(
-                os.path.join(PAPERS_DIR, f"{REAL_PDF_ID}.pdf"),
-                os.path.join(pp, f"{REAL_PDF_ID}.pdf"),
-            )
+        # Make the fallback download actually place the PDF
+        def do_download(results, paper_db, paper_path):
+            for r in results:
+                _touch_pdf(paper_path, r["id"])
             return True
 
         mock_dl.side_effect = do_download
 
-        summarizer = _make_mock_summarizer(VALID_LLM_RESPONSE)
+        summarizer = summarizer_factory(VALID_LLM_RESPONSE_JSON)
         summarize_records(
             records=tmp_db.find(summarized=False),
             summarizer=summarizer,
@@ -223,74 +250,228 @@ class TestSummarizeRecordsMocked:
         )
 
         mock_dl.assert_called_once()
+        assert [r["id"] for r in mock_dl.call_args.kwargs["results"]] == [REAL_PDF_ID]
         assert len(tmp_db.find(summarized=True)) == 1
 
-    def test_interest_score_clamped_high(self, tmp_path, tmp_db):
-        """interest_score above 10 should be clamped to 10."""
+    @patch("secnews.utils_summary.download_papers")
+    def test_existing_pdf_not_downloaded(
+        self, mock_dl, tmp_path, tmp_db, summarizer_factory
+    ):
+        """PDFs already on disk are not re-fetched before summarizing."""
         paper_path = str(tmp_path / "papers")
         os.makedirs(paper_path)
-        shutil.copy(
-            os.path.join(PAPERS_DIR, f"{REAL_PDF_ID}.pdf"),
-            os.path.join(paper_path, f"{REAL_PDF_ID}.pdf"),
-        )
+        _touch_pdf(paper_path)
         tmp_db.insert({
             "id": REAL_PDF_ID,
             "url": f"http://arxiv.org/pdf/{REAL_PDF_ID}.pdf",
             "published": "2026-02-10T00:00:00Z",
             "title": "Test",
-            "authors": [],
             "downloaded": True,
             "summarized": False,
         })
-        response = dict(VALID_LLM_RESPONSE, interest_score=99)
-        summarizer = _make_mock_summarizer(response)
+
         summarize_records(
             records=tmp_db.find(summarized=False),
-            summarizer=summarizer,
+            summarizer=summarizer_factory(VALID_LLM_RESPONSE_JSON),
             summarizer_prompt="Test prompt",
             paper_path=paper_path,
             paper_db=tmp_db,
         )
-        rec = tmp_db.find(summarized=True)[0]
-        assert rec["interest_score"] == 10
 
-    def test_interest_score_clamped_low(self, tmp_path, tmp_db):
-        """interest_score below 1 should be clamped to 1."""
+        mock_dl.assert_not_called()
+        assert len(tmp_db.find(summarized=True)) == 1
+
+    @patch("secnews.utils_summary.time.sleep")
+    def test_pdfs_parsed_off_main_thread(self, _sleep, tmp_path, tmp_db, summarizer_factory):
+        """PDF text extraction runs on the summarization worker threads."""
         paper_path = str(tmp_path / "papers")
         os.makedirs(paper_path)
-        shutil.copy(
-            os.path.join(PAPERS_DIR, f"{REAL_PDF_ID}.pdf"),
-            os.path.join(paper_path, f"{REAL_PDF_ID}.pdf"),
+        for paper_id in ("2601.00011v1", "2601.00012v1"):
+            open(os.path.join(paper_path, f"{paper_id}.pdf"), "wb").close()
+            tmp_db.insert({
+                "id": paper_id,
+                "url": f"http://arxiv.org/pdf/{paper_id}.pdf",
+                "published": "2026-02-10T00:00:00Z",
+                "title": "Threaded",
+                "downloaded": True,
+                "summarized": False,
+            })
+
+        read_threads = []
+
+        def fake_read_pdf(path, max_pages=None):
+            read_threads.append(threading.current_thread())
+            return {"pages": 1, "content": "text", "characters": 4}
+
+        with patch("secnews.utils_summary.read_pdf", side_effect=fake_read_pdf):
+            summarize_records(
+                records=tmp_db.find(summarized=False),
+                summarizer=summarizer_factory(VALID_LLM_RESPONSE_JSON),
+                summarizer_prompt="Test prompt",
+                paper_path=paper_path,
+                paper_db=tmp_db,
+            )
+
+        assert len(read_threads) == 2
+        assert threading.main_thread() not in read_threads
+        assert len(tmp_db.find(summarized=True)) == 2
+
+    @patch("secnews.utils_summary.time.sleep")
+    def test_real_pdf_reads_on_worker_threads(
+        self, _sleep, tmp_path, tmp_db, monkeypatch, real_paper_path, summarizer_factory
+    ):
+        """The real extractor gives every worker the full, uncorrupted text."""
+        monkeypatch.setattr(utils_summary, "read_pdf", utils_papers.read_pdf)
+        source = os.path.join(real_paper_path, f"{REAL_PDF_ID}.pdf")
+        paper_ids = [f"2601.0004{n}v1" for n in range(8)]
+        for paper_id in paper_ids:
+            shutil.copyfile(source, tmp_path / f"{paper_id}.pdf")
+            tmp_db.insert({
+                "id": paper_id,
+                "url": f"http://arxiv.org/pdf/{paper_id}.pdf",
+                "published": "2026-02-10T00:00:00Z",
+                "title": "Threaded real PDF",
+                "downloaded": True,
+                "summarized": False,
+            })
+
+        summarizer = summarizer_factory(VALID_LLM_RESPONSE_JSON)
+        summarize_records(
+            records=tmp_db.find(summarized=False),
+            summarizer=summarizer,
+            summarizer_prompt="Test prompt",
+            paper_path=str(tmp_path),
+            paper_db=tmp_db,
+            max_workers=4,
+        )
+
+        expected = utils_papers.read_pdf(source)["content"]
+        contents = [
+            call.kwargs["messages"][1]["content"]
+            for call in summarizer.chat.completions.create.call_args_list
+        ]
+        assert contents == [expected] * len(paper_ids)
+        assert len(tmp_db.find(summarized=True)) == len(paper_ids)
+
+    @patch("secnews.utils_summary.time.sleep")
+    def test_records_summarized_concurrently(
+        self, _sleep, tmp_path, tmp_db, summarizer_factory
+    ):
+        """Both LLM calls must be in flight at once for the barrier to release."""
+        for paper_id in ("2601.00021v1", "2601.00022v1"):
+            tmp_db.insert({
+                "id": paper_id,
+                "url": f"http://arxiv.org/pdf/{paper_id}.pdf",
+                "published": "2026-02-10T00:00:00Z",
+                "title": "Parallel",
+                "abstract": "We study prompt injection against LLM agents. " * 10,
+                "downloaded": False,
+                "summarized": False,
+            })
+
+        barrier = threading.Barrier(2, timeout=5)
+        summarizer = summarizer_factory(VALID_LLM_RESPONSE_JSON)
+        response = summarizer.chat.completions.create.return_value
+
+        def create(**kwargs):
+            barrier.wait()
+            return response
+
+        summarizer.chat.completions.create.side_effect = create
+        summarize_records(
+            records=tmp_db.find(summarized=False),
+            summarizer=summarizer,
+            summarizer_prompt="Test prompt",
+            paper_path=str(tmp_path),
+            paper_db=tmp_db,
+            use_abstract_only=True,
+            max_workers=2,
         )
+
+        assert len(tmp_db.find(summarized=True)) == 2
+
+    @patch("secnews.utils_summary.download_papers")
+    def test_abstract_only_skips_pdf(self, mock_dl, tmp_path, tmp_db, summarizer_factory):
+        """With use_abstract_only, a long abstract is summarized without any PDF."""
+        paper_path = str(tmp_path / "papers")
+        os.makedirs(paper_path)
+        abstract = "We study prompt injection against LLM agents. " * 10
         tmp_db.insert({
             "id": REAL_PDF_ID,
             "url": f"http://arxiv.org/pdf/{REAL_PDF_ID}.pdf",
             "published": "2026-02-10T00:00:00Z",
-            "title": "Test",
+            "title": "Abstract Paper",
+            "authors": ["Alice Smith"],
+            "abstract": abstract,
+            "downloaded": False,
+            "summarized": False,
+        })
+
+        summarizer = summarizer_factory(VALID_LLM_RESPONSE_JSON)
+        summarize_records(
+            records=tmp_db.find(summarized=False),
+            summarizer=summarizer,
+            summarizer_prompt="Test prompt",
+            paper_path=paper_path,
+            paper_db=tmp_db,
+            use_abstract_only=True,
+        )
+
+        mock_dl.assert_not_called()
+        messages = summarizer.chat.completions.create.call_args.kwargs["messages"]
+        assert messages[1]["content"] == (
+            f"Title: Abstract Paper\nAuthors: Alice Smith\nAbstract: {abstract}"
+        )
+        rec = tmp_db.find(summarized=True)[0]
+        assert rec["one_liner"] == "A novel approach to LLM security."
+        # No PDF to check the title page against, so affiliations are dropped
+        assert rec["affiliations"] == []
+
+    def test_abstract_only_short_abstract_uses_pdf(
+        self, tmp_path, tmp_db, summarizer_factory
+    ):
+        """Abstracts below MIN_ABSTRACT_CHARS fall back to the full PDF text."""
+        paper_path = str(tmp_path / "papers")
+        os.makedirs(paper_path)
+        _touch_pdf(paper_path)
+        tmp_db.insert({
+            "id": REAL_PDF_ID,
+            "url": f"http://arxiv.org/pdf/{REAL_PDF_ID}.pdf",
+            "published": "2026-02-10T00:00:00Z",
+            "title": "Short Abstract Paper",
             "authors": [],
+            "abstract": "Too short.",
             "downloaded": True,
             "summarized": False,
         })
-        response = dict(VALID_LLM_RESPONSE, interest_score=-5)
-        summarizer = _make_mock_summarizer(response)
+
+        summarizer = summarizer_factory(VALID_LLM_RESPONSE_JSON)
         summarize_records(
             records=tmp_db.find(summarized=False),
             summarizer=summarizer,
             summarizer_prompt="Test prompt",
             paper_path=paper_path,
             paper_db=tmp_db,
+            use_abstract_only=True,
         )
-        rec = tmp_db.find(summarized=True)[0]
-        assert rec["interest_score"] == 1
 
-    def test_interest_score_non_numeric_defaults(self, tmp_path, tmp_db):
-        """Non-numeric interest_score should default to 5."""
+        messages = summarizer.chat.completions.create.call_args.kwargs["messages"]
+        assert not messages[1]["content"].startswith("Title: Short Abstract Paper")
+        assert len(tmp_db.find(summarized=True)) == 1
+
+    @pytest.mark.parametrize("raw_score, expected", [
+        (99, 10),               # above range clamps to 10
+        (-5, 1),                # below range clamps to 1
+        ("not a number", 5),    # non-numeric defaults to 5
+        (7, 7),                 # in range is kept
+    ])
+    @patch("secnews.utils_summary.time.sleep")
+    def test_interest_score_normalized(
+        self, _sleep, raw_score, expected, tmp_path, tmp_db, summarizer_factory
+    ):
         paper_path = str(tmp_path / "papers")
         os.makedirs(paper_path)
-        shutil.copy(
-            os.path.join(PAPERS_DIR, f"{REAL_PDF_ID}.pdf"),
-            os.path.join(paper_path, f"{REAL_PDF_ID}.pdf"),
-        )
+        _touch_pdf(paper_path)
         tmp_db.insert({
             "id": REAL_PDF_ID,
             "url": f"http://arxiv.org/pdf/{REAL_PDF_ID}.pdf",
@@ -300,263 +481,138 @@ class TestSummarizeRecordsMocked:
             "downloaded": True,
             "summarized": False,
         })
-        response = dict(VALID_LLM_RESPONSE, interest_score="not a number")
-        summarizer = _make_mock_summarizer(response)
         summarize_records(
             records=tmp_db.find(summarized=False),
-            summarizer=summarizer,
+            summarizer=summarizer_factory(dict(VALID_LLM_RESPONSE, interest_score=raw_score)),
             summarizer_prompt="Test prompt",
             paper_path=paper_path,
             paper_db=tmp_db,
         )
         rec = tmp_db.find(summarized=True)[0]
-        assert rec["interest_score"] == 5
+        assert rec["interest_score"] == expected
 
 
 # ---------------------------------------------------------------------------
-# Author/affiliation validation
+# On-disk LLM response cache
 # ---------------------------------------------------------------------------
 
 
-class TestClassifyRelevance:
-
-    def _make_classifier(self, relevant):
-        classifier = MagicMock()
-        mock_choice = MagicMock()
-        mock_choice.message.content = json.dumps({"relevant": relevant})
-        mock_result = MagicMock()
-        mock_result.choices = [mock_choice]
-        classifier.chat.completions.create.return_value = mock_result
-        return classifier
-
-    def test_marks_relevant_true(self, tmp_db):
-        tmp_db.insert({
-            "id": "r1", "url": "http://x.pdf",
-            "published": "2026-02-15T00:00:00Z",
-            "title": "Jailbreak Attack on LLMs",
-            "downloaded": True, "summarized": True,
-            "tag": "security", "one_liner": "About jailbreaks.",
-            "emoji": "🛡️", "points": ["A"],
-        })
-        classify_relevance(
-            records=tmp_db.find(summarized=True),
-            classifier=self._make_classifier(True),
-            relevance_prompt="test",
-            paper_db=tmp_db,
-        )
-        assert tmp_db.find()[0]["relevant"] is True
-
-    def test_marks_relevant_false(self, tmp_db):
-        tmp_db.insert({
-            "id": "r2", "url": "http://x.pdf",
-            "published": "2026-02-15T00:00:00Z",
-            "title": "ZK Proofs for ML",
-            "downloaded": True, "summarized": True,
-            "tag": "security", "one_liner": "About zero knowledge.",
-            "emoji": "🛡️", "points": ["A"],
-        })
-        classify_relevance(
-            records=tmp_db.find(summarized=True),
-            classifier=self._make_classifier(False),
-            relevance_prompt="test",
-            paper_db=tmp_db,
-        )
-        assert tmp_db.find()[0]["relevant"] is False
-
-    def test_general_tag_auto_irrelevant(self, tmp_db):
-        """Papers tagged 'general' are auto-marked irrelevant without an LLM call."""
-        tmp_db.insert({
-            "id": "g1", "url": "http://x.pdf",
-            "published": "2026-02-15T00:00:00Z",
-            "title": "Multi-armed Bandits",
-            "downloaded": True, "summarized": True,
-            "tag": "general", "one_liner": "About bandits.",
-            "emoji": "🎰", "points": ["A"],
-        })
-        # Classifier should NOT be called
-        classifier = MagicMock()
-        classify_relevance(
-            records=tmp_db.find(summarized=True),
-            classifier=classifier,
-            relevance_prompt="test",
-            paper_db=tmp_db,
-        )
-        classifier.chat.completions.create.assert_not_called()
-        assert tmp_db.find()[0]["relevant"] is False
+class TestLLMCache:
+
+    @pytest.fixture
+    def cache_dir(self, isolated_llm_cache):
+        """The per-test cache directory set up by conftest's isolated_llm_cache."""
+        return utils_summary.LLM_CACHE_DIR
+
+    def test_disabled_by_default(self, cache_dir, summarizer_factory):
+        """Without SECNEWS_LLM_CACHE=1 every call goes to the API."""
+        client = summarizer_factory({"relevant": True})
+        _chat_json(client, "prompt", "content")
+        _chat_json(client, "prompt", "content")
+        assert client.chat.completions.create.call_count == 2
+        assert not cache_dir.exists()
+
+    def test_hit_skips_api_call(self, cache_dir, monkeypatch, summarizer_factory):
+        monkeypatch.setenv("SECNEWS_LLM_CACHE", "1")
+        client = summarizer_factory({"relevant": True})
+        assert _chat_json(client, "prompt", "content") == {"relevant": True}
+        assert _chat_json(client, "prompt", "content") == {"relevant": True}
+        assert client.chat.completions.create.call_count == 1
+        assert len(list(cache_dir.glob("*.json"))) == 1
+
+    def test_prompt_change_misses(self, cache_dir, monkeypatch, summarizer_factory):
+        """A different system prompt or content yields a different key."""
+        monkeypatch.setenv("SECNEWS_LLM_CACHE", "1")
+        client = summarizer_factory({"relevant": True})
+        _chat_json(client, "prompt v1", "content")
+        _chat_json(client, "prompt v2", "content")
+        _chat_json(client, "prompt v1", "other content")
+        assert client.chat.completions.create.call_count == 3
+
+    @patch("secnews.utils_summary.time.sleep")
+    def test_resummarize_reuses_cached_responses(
+        self, _sleep, cache_dir, monkeypatch, tmp_path, tmp_db, summarizer_factory
+    ):
+        """Summarizing the same records again makes no further API calls."""
+        monkeypatch.setenv("SECNEWS_LLM_CACHE", "1")
+        for paper_id in ("2601.00031v1", "2601.00032v1"):
+            tmp_db.insert({
+                "id": paper_id,
+                "url": f"http://arxiv.org/pdf/{paper_id}.pdf",
+                "published": "2026-02-10T00:00:00Z",
+                "title": f"Cached {paper_id}",
+                "abstract": "We study prompt injection against LLM agents. " * 10,
+                "downloaded": False,
+                "summarized": False,
+            })
+        summarizer = summarizer_factory(VALID_LLM_RESPONSE_JSON)
+
+        for _ in range(2):
+            tmp_db.reset_summarized("2026-01-01T00:00:00Z")
+            summarize_records(
+                records=tmp_db.find(summarized=False),
+                summarizer=summarizer,
+                summarizer_prompt="Test prompt",
+                paper_path=str(tmp_path / "papers"),
+                paper_db=tmp_db,
+                use_abstract_only=True,
+            )
+            assert len(tmp_db.find(summarized=True)) == 2
 
-    def test_skips_already_classified(self, tmp_db):
-        """Records with 'relevant' already set are not re-classified."""
-        tmp_db.insert({
-            "id": "s1", "url": "http://x.pdf",
-            "published": "2026-02-15T00:00:00Z",
-            "title": "Already Classified",
-            "downloaded": True, "summarized": True,
-            "tag": "security", "one_liner": "Done.",
-            "emoji": "🛡️", "points": ["A"],
-            "relevant": True,
-        })
-        classifier = MagicMock()
-        classify_relevance(
-            records=tmp_db.find(summarized=True),
-            classifier=classifier,
-            relevance_prompt="test",
-            paper_db=tmp_db,
-        )
-        classifier.chat.completions.create.assert_not_called()
+        assert summarizer.chat.completions.create.call_count == 2
 
-    def test_defaults_to_relevant_on_error(self, tmp_db):
-        """On LLM error, paper is marked relevant to avoid dropping good papers."""
+    @patch("secnews.utils_summary.time.sleep")
+    def test_incomplete_summary_not_cached(
+        self, _sleep, cache_dir, monkeypatch, tmp_path, tmp_db
+    ):
+        """A summary missing required keys is retried on the next run, not replayed."""
+        monkeypatch.setenv("SECNEWS_LLM_CACHE", "1")
         tmp_db.insert({
-            "id": "e1", "url": "http://x.pdf",
-            "published": "2026-02-15T00:00:00Z",
-            "title": "Error Paper",
-            "downloaded": True, "summarized": True,
-            "tag": "security", "one_liner": "Something.",
-            "emoji": "🛡️", "points": ["A"],
+            "id": "2601.00051v1",
+            "url": "http://arxiv.org/pdf/2601.00051v1.pdf",
+            "published": "2026-02-10T00:00:00Z",
+            "title": "Incomplete",
+            "abstract": "We study prompt injection against LLM agents. " * 10,
+            "downloaded": False,
+            "summarized": False,
         })
-        classifier = MagicMock()
-        classifier.chat.completions.create.side_effect = Exception("API down")
-        classify_relevance(
-            records=tmp_db.find(summarized=True),
-            classifier=classifier,
-            relevance_prompt="test",
-            paper_db=tmp_db,
-        )
-        assert tmp_db.find()[0]["relevant"] is True
 
+        def run(summarizer):
+            summarize_records(
+                records=tmp_db.find(summarized=False),
+                summarizer=summarizer,
+                summarizer_prompt="Test prompt",
+                paper_path=str(tmp_path / "papers"),
+                paper_db=tmp_db,
+                use_abstract_only=True,
+            )
 
-class TestClassifyProjectRelevance:
-
-    def _make_classifier(self, projects):
-        classifier = MagicMock()
-        mock_choice = MagicMock()
-        mock_choice.message.content = json.dumps({"projects": projects})
-        mock_result = MagicMock()
-        mock_result.choices = [mock_choice]
-        classifier.chat.completions.create.return_value = mock_result
-        return classifier
+        run(_StubClient(json.dumps({"one_liner": "x"})))  # no "findings"
+        assert tmp_db.find(summarized=True) == []
+        assert not cache_dir.exists()
 
-    def _insert_record(self, tmp_db, record_id="p1"):
-        tmp_db.insert({
-            "id": record_id, "url": "http://x.pdf",
-            "published": "2026-02-15T00:00:00Z",
-            "title": "Jailbreak Attack on LLMs",
-            "downloaded": True, "summarized": True,
-            "tag": "security", "one_liner": "About jailbreaks.",
-            "emoji": "🛡️", "points": ["A"], "relevant": True,
-        })
-
-    def test_matches_valid_projects(self, tmp_db):
-        """LLM returns valid project IDs — stored correctly."""
-        self._insert_record(tmp_db)
-        classify_project_relevance(
-            records=tmp_db.find(summarized=True),
-            classifier=self._make_classifier(["proj-alpha", "proj-beta"]),
-            prompt="test",
-            project_ids=["proj-alpha", "proj-beta", "proj-gamma"],
-            paper_db=tmp_db,
-        )
-        assert tmp_db.find()[0]["projects"] == ["proj-alpha", "proj-beta"]
-
-    def test_no_matches_returns_empty(self, tmp_db):
-        """LLM returns no matches — stored as empty list."""
-        self._insert_record(tmp_db)
-        classify_project_relevance(
-            records=tmp_db.find(summarized=True),
-            classifier=self._make_classifier([]),
-            prompt="test",
-            project_ids=["proj-alpha"],
-            paper_db=tmp_db,
-        )
-        assert tmp_db.find()[0]["projects"] == []
-
-    def test_strips_hallucinated_ids(self, tmp_db):
-        """LLM returns unknown project IDs — hallucinated IDs are stripped."""
-        self._insert_record(tmp_db)
-        classify_project_relevance(
-            records=tmp_db.find(summarized=True),
-            classifier=self._make_classifier(["proj-alpha", "hallucinated-proj"]),
-            prompt="test",
-            project_ids=["proj-alpha", "proj-beta"],
-            paper_db=tmp_db,
-        )
-        assert tmp_db.find()[0]["projects"] == ["proj-alpha"]
-
-    def test_skips_already_classified(self, tmp_db):
-        """Records with 'projects' already set are not re-classified."""
-        self._insert_record(tmp_db)
-        tmp_db.update("p1", {"projects": ["proj-alpha"]})
-        classifier = MagicMock()
-        classify_project_relevance(
-            records=tmp_db.find(summarized=True),
-            classifier=classifier,
-            prompt="test",
-            project_ids=["proj-alpha"],
-            paper_db=tmp_db,
-        )
-        classifier.chat.completions.create.assert_not_called()
-
-    def test_defaults_to_empty_on_error(self, tmp_db):
-        """On LLM error, paper gets empty projects list."""
-        self._insert_record(tmp_db)
-        classifier = MagicMock()
-        classifier.chat.completions.create.side_effect = Exception("API down")
-        classify_project_relevance(
-            records=tmp_db.find(summarized=True),
-            classifier=classifier,
-            prompt="test",
-            project_ids=["proj-alpha"],
-            paper_db=tmp_db,
-        )
-        assert tmp_db.find()[0]["projects"] == []
-
-
-class TestValidateAffiliations:
-
-    def test_keeps_affiliations_when_authors_match(self):
-        """Affiliations are kept when arXiv authors appear in PDF text."""
-        affiliations = ["MIT", "Stanford"]
-        authors = ["Alice Smith", "Bob Jones"]
-        pdf_text = "Alice Smith and Bob Jones from MIT and Stanford..."
-        result = _validate_affiliations(affiliations, authors, pdf_text, "test")
-        assert result == ["MIT", "Stanford"]
-
-    def test_discards_affiliations_when_authors_dont_match(self):
-        """Affiliations are discarded when arXiv authors are not in the PDF."""
-        affiliations = ["MIT", "Stanford"]
-        authors = ["Alice Smith", "Bob Jones"]
-        pdf_text = "Completely unrelated text with no author names at all..."
-        result = _validate_affiliations(affiliations, authors, pdf_text, "test")
-        assert result == []
-
-    def test_partial_match_above_threshold(self):
-        """At least 50% of authors matching keeps the affiliations."""
-        affiliations = ["MIT"]
-        authors = ["Alice Smith", "Bob Jones"]
-        # Only Smith appears
-        pdf_text = "Smith et al. present a study on LLM security..."
-        result = _validate_affiliations(affiliations, authors, pdf_text, "test")
-        assert result == ["MIT"]
-
-    def test_partial_match_below_threshold(self):
-        """Below 50% match discards affiliations."""
-        affiliations = ["MIT"]
-        authors = ["Alice Smith", "Bob Jones", "Charlie Brown"]
-        # Only Smith appears (1/3 = 33%)
-        pdf_text = "Smith et al. present a study on LLM security..."
-        result = _validate_affiliations(affiliations, authors, pdf_text, "test")
-        assert result == []
-
-    def test_empty_authors_returns_affiliations_unchanged(self):
-        """If no arXiv authors, skip validation and return affiliations as-is."""
-        affiliations = ["MIT"]
-        result = _validate_affiliations(affiliations, [], "any text", "test")
-        assert result == ["MIT"]
-
-    def test_empty_affiliations_returns_empty(self):
-        """Empty affiliations stay empty regardless of authors."""
-        result = _validate_affiliations([], ["Alice Smith"], "Alice Smith...", "test")
-        assert result == []
+        run(_StubClient(VALID_LLM_RESPONSE_JSON))
+        rec = tmp_db.find(summarized=True)[0]
+        assert rec["one_liner"] == "A novel approach to LLM security."
+        assert len(list(cache_dir.glob("*.json"))) == 1
+
+    def test_incomplete_cached_entry_is_a_miss(self, cache_dir, monkeypatch, summarizer_factory):
+        """Entries written before required keys were checked are refetched."""
+        monkeypatch.setenv("SECNEWS_LLM_CACHE", "1")
+        monkeypatch.delenv("AZURE_OPENAI_SUMMARY_MODEL_NAME", raising=False)
+        cache_path = utils_summary._llm_cache_path(None, "prompt", "content")
+        cache_dir.mkdir()
+        cache_path.write_text(json.dumps({"one_liner": "x"}))
+        client = summarizer_factory(VALID_LLM_RESPONSE_JSON)
+        loaded = _chat_json(client, "prompt", "content", required=("findings", "one_liner"))
+        assert loaded == VALID_LLM_RESPONSE
+        assert json.loads(cache_path.read_text()) == VALID_LLM_RESPONSE
+
+    def test_malformed_response_not_cached(self, cache_dir, monkeypatch):
+        monkeypatch.setenv("SECNEWS_LLM_CACHE", "1")
+        with pytest.raises(ValueError):
+            _chat_json(_StubClient("This is not JSON at all"), "prompt", "content")
+        assert not cache_dir.exists()
 
 
 # ---------------------------------------------------------------------------
@@ -565,18 +621,10 @@ class TestValidateAffiliations:
 
 
 @pytest.mark.integration
-def test_real_llm_summarization(tmp_path, tmp_db):
+def test_real_llm_summarization(tmp_path, tmp_db, azure_openai_client):
     """End-to-end test with real Azure OpenAI. Run with: pytest -m integration"""
-    import dotenv
-    from azure.identity import DefaultAzureCredential, get_bearer_token_provider
-    from openai import AzureOpenAI
-
-    dotenv.load_dotenv(".env")
-
-    endpoint = os.environ.get("AZURE_OPENAI_ENDPOINT")
-    model = os.environ.get("AZURE_OPENAI_SUMMARY_MODEL_NAME")
-    if not all([endpoint, model]):
-        pytest.skip("Azure OpenAI endpoint/model not configured")
+    if not os.environ.get("AZURE_OPENAI_SUMMARY_MODEL_NAME"):
+        pytest.skip("Azure OpenAI summary model not configured")
 
     paper_path = str(tmp_path / "papers")
     os.makedirs(paper_path)
@@ -594,16 +642,6 @@ def test_real_llm_summarization(tmp_path, tmp_db):
         "summarized": False,
     })
 
-    credential = DefaultAzureCredential()
-    token_provider = get_bearer_token_provider(
-        credential, "https://cognitiveservices.azure.com/.default"
-    )
-    oai = AzureOpenAI(
-        azure_endpoint=endpoint,
-        azure_ad_token_provider=token_provider,
-        api_version="2025-01-01-preview",
-    )
-
     system_prompt = """Assume the role of a technical writer. 
 Format the output as a JSON object with:
 'findings' // array of 3 single-sentence findings.
@@ -613,7 +651,7 @@ Format the output as a JSON object with:
 
     summarize_records(
         records=tmp_db.find(summarized=False),
-        summarizer=oai,
+        summarizer=azure_openai_client,
         summarizer_prompt=system_prompt,
         paper_path=paper_path,
         paper_db=tmp_db,